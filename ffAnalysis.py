@@ -5,7 +5,9 @@
 # Author:         Zachariah Irwin
 # Last modified:  December 30, 2023
 #-----------------------------------------------------------------------------
-import sys, os, argparse, subprocess
+import sys, os, io, re, csv, json, queue, base64, hashlib, html, shutil, tempfile, warnings, argparse, contextlib, subprocess
+import threading, http.client, http.server, urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 try:
   import numpy as np
@@ -14,6 +16,7 @@ except ImportError:
 
 try:
   import matplotlib.pyplot as plt
+  from matplotlib import cbook
 except ImportError:
   sys.exit("ERROR. Matplotlib not installed.")
 
@@ -22,6 +25,11 @@ try:
 except ImportError:
   sys.exit("ERROR. Pandas not installed.")
 
+try:
+  from scipy import stats
+except ImportError:
+  sys.exit("ERROR. SciPy not installed.")
+
 try:
   from statsmodels.formula.api import ols
 except ImportError:
@@ -35,6 +43,12 @@ except ImportError:
 # args     (object)  command line arguments
 #----------------------------------------------------------------------
 def readData(args):
+  #-------------------------------------
+  # Import league data from Sleeper, if
+  # requested, instead of the .xlsx file.
+  #-------------------------------------
+  if args.sleeper:
+    return sleeperData(args)
   #---------------------
   # Read in league data.
   #---------------------
@@ -53,20 +67,522 @@ def readData(args):
   
   return leagueData
 #----------------------------------------------------------------------
+# Sleeper importer. Weeks are fetched concurrently over a pool of
+# persistent connections, and every response is cached on disk with
+# its ETag so that unchanged weeks are not downloaded again.
+#----------------------------------------------------------------------
+SLEEPER_URL         = 'https://api.sleeper.app/v1'
+SLEEPER_CONNECTIONS = 8
+#----------------------------------------------------------------------
+# Function to make a pool of persistent HTTP connections to the
+# Sleeper API. Connections are opened when first used, and at most
+# a_Size are open at once.
+# ----------
+# Arguments:
+# ----------
+# a_URL    (str)   base URL of the Sleeper API
+# a_Size   (int)   number of connections in the pool
+# ----------
+# Returns:
+# ----------
+# pool     (dict)  base URL, path prefix, connection factory and the
+#                  queue of idle connections
+#----------------------------------------------------------------------
+def sleeperPool(a_URL, a_Size):
+  url = urllib.parse.urlsplit(a_URL)
+  if url.scheme not in ['http', 'https']:
+    sys.exit("-------------------\nCOMMAND LINE ERROR:\n-------------------\nSleeper URL must start with http:// or https://.")
+  connection = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+  pool       = {'url'     : a_URL.rstrip('/'),
+                'prefix'  : url.path.rstrip('/'),
+                'connect' : lambda: connection(url.netloc, timeout=30),
+                'idle'    : queue.LifoQueue()}
+  for i in range(0, a_Size):
+    pool['idle'].put(None)
+
+  return pool
+#----------------------------------------------------------------------
+# Function to fetch a JSON document from the Sleeper API, using the
+# on-disk cache. A cached document is revalidated with its ETag, and
+# only downloaded again if it changed.
+# ----------
+# Arguments:
+# ----------
+# a_Pool   (dict)   connection pool from sleeperPool
+# a_Path   (str)    API path, e.g. /league/<id>/matchups/1
+# a_Cache  (str)    cache directory
+# ----------
+# Returns:
+# ----------
+# data     (object) decoded JSON document
+#----------------------------------------------------------------------
+def sleeperFetch(a_Pool, a_Path, a_Cache):
+  url       = a_Pool['url'] + a_Path
+  cacheFile = a_Cache + '/' + hashlib.sha1(url.encode()).hexdigest() + '.json'
+  cached    = None
+  if os.path.exists(cacheFile):
+    with open(cacheFile) as f:
+      cached = json.load(f)
+  headers = {'Accept': 'application/json'}
+  if cached is not None and cached['etag']:
+    headers['If-None-Match'] = cached['etag']
+  #---------------------------------------------
+  # Borrow a connection, and retry once on a new
+  # one if the server closed it while idle.
+  #---------------------------------------------
+  connection = a_Pool['idle'].get()
+  try:
+    for attempt in range(0, 2):
+      if connection is None:
+        connection = a_Pool['connect']()
+      try:
+        connection.request('GET', a_Pool['prefix'] + a_Path, headers=headers)
+        response = connection.getresponse()
+        body     = response.read()
+        break
+      except (http.client.HTTPException, OSError) as error:
+        connection.close()
+        connection = None
+        if attempt == 1:
+          sys.exit("ERROR. Could not fetch " + url + ": " + str(error))
+  finally:
+    a_Pool['idle'].put(connection)
+
+  if response.status == 304 and cached is not None:
+    return cached['data']
+  if response.status != 200:
+    sys.exit("ERROR. Fetching " + url + " returned HTTP status " + str(response.status) + ".")
+  data = json.loads(body)
+  #-------------------------------------------
+  # Replace the cache entry atomically, so runs
+  # sharing the cache never read partial files.
+  #-------------------------------------------
+  fd, tmpname = tempfile.mkstemp(dir=a_Cache, suffix='.tmp')
+  with os.fdopen(fd, 'w') as f:
+    json.dump({'url': url, 'etag': response.getheader('ETag'), 'data': data}, f)
+  os.replace(tmpname, cacheFile)
+
+  return data
+#----------------------------------------------------------------------
+# Function to read a saved JSON document, laid out like the API paths,
+# e.g. <dir>/league/<id>/matchups/1.json.
+# ----------
+# Arguments:
+# ----------
+# a_Dir    (str)    directory of saved Sleeper JSON
+# a_Path   (str)    API path, e.g. /league/<id>/matchups/1
+# ----------
+# Returns:
+# ----------
+# data     (object) decoded JSON document
+#----------------------------------------------------------------------
+def sleeperLoad(a_Dir, a_Path):
+  try:
+    with open(a_Dir + a_Path + '.json') as f:
+      return json.load(f)
+  except FileNotFoundError:
+    sys.exit("ERROR. Saved Sleeper file " + a_Dir + a_Path + ".json not found.")
+#----------------------------------------------------------------------
+# Function to import a Sleeper league into the same pandas dataframe
+# object readData makes from the .xlsx sheets. Points are the
+# 'custom_points' if the commissioner overrode them, and projections
+# are read from 'projected_points' where an export provides them.
+# Sleeper does not report possible scores, so that sheet is left empty.
+# Every week of the regular season is imported; weeks not played yet,
+# which Sleeper reports as 0 points, are blank like in the .xlsx file.
+# ----------
+# Arguments:
+# ----------
+# args     (object)  command line arguments
+# ----------
+# Returns:
+# ----------
+# leagueData (object) pandas dataframe object for league data, with
+#                     the Actual, Projected, Possible, Record and
+#                     Matchup Differential sheets
+#----------------------------------------------------------------------
+def sleeperData(args):
+  if args.sleeper_dir:
+    fetch = lambda path: sleeperLoad(args.sleeper_dir.rstrip('/'), path)
+  else:
+    cache = LEAGUE + '/' + args.year + '/sleeper_cache'
+    os.makedirs(cache, exist_ok=True)
+    pool  = sleeperPool(args.sleeper_url, SLEEPER_CONNECTIONS)
+    fetch = lambda path: sleeperFetch(pool, path, cache)
+  #----------------------------------------------
+  # League, owners and rosters, then every week of
+  # the regular season, all fetched concurrently.
+  #----------------------------------------------
+  path = '/league/' + args.sleeper
+  with ThreadPoolExecutor(max_workers=SLEEPER_CONNECTIONS) as executor:
+    league, users, rosters = executor.map(fetch, [path, path + '/users', path + '/rosters'])
+    if not league or not rosters:
+      sys.exit("ERROR. Sleeper league " + args.sleeper + " not found.")
+    settings = league.get('settings') or {}
+    weeks    = list(range(settings.get('start_week') or 1, settings.get('playoff_week_start') or 15))
+    matchups = list(executor.map(fetch, [path + '/matchups/' + str(week) for week in weeks]))
+  #-------------------------------------
+  # Team owner names, in roster order.
+  #-------------------------------------
+  names         = {user['user_id']: user.get('display_name') for user in users or []}
+  rosters       = sorted(rosters, key=lambda roster: roster['roster_id'])
+  teamOwnerList = [names.get(roster.get('owner_id')) or 'Team ' + str(roster['roster_id']) for roster in rosters]
+  column        = {roster['roster_id']: teamID for teamID, roster in enumerate(rosters)}
+  #-------------------------------------------
+  # Weeks x teams points, projections and the
+  # matchup each team played in.
+  #-------------------------------------------
+  nTeams    = len(rosters)
+  actual    = np.full((len(weeks), nTeams), np.nan)
+  projected = np.full((len(weeks), nTeams), np.nan)
+  matchup   = np.full((len(weeks), nTeams), np.nan)
+  for weekID, week in enumerate(matchups):
+    for entry in week or []:
+      if entry['roster_id'] not in column:
+        continue
+      teamID = column[entry['roster_id']]
+      points = entry.get('custom_points')
+      actual[weekID, teamID]    = points if points is not None else (entry.get('points') or 0)
+      projected[weekID, teamID] = entry.get('projected_points') if entry.get('projected_points') is not None else np.nan
+      matchup[weekID, teamID]   = entry.get('matchup_id') if entry.get('matchup_id') is not None else np.nan
+  #-----------------------------------
+  # Blank the weeks not played yet.
+  #-----------------------------------
+  nWeeks = len(weeks)
+  played = np.nansum(np.abs(actual), axis=1) > 0
+  actual[~played] = np.nan
+  #------------------------------------------------
+  # Opponents share a matchup ID, weeks x teams x
+  # teams; teams without an opponent have no result.
+  #------------------------------------------------
+  isOpp    = (matchup[:,:,None] == matchup[:,None,:]) & ~np.eye(nTeams, dtype=bool)
+  hasOpp   = np.any(isOpp, axis=2)
+  opponent = np.einsum('wij,wj->wi', isOpp, np.nan_to_num(actual))
+  diff     = np.where(hasOpp, actual - opponent, np.nan)
+  record   = (diff > 0) + 0.5*(diff == 0)
+  if settings.get('league_average_match') and np.any(played):
+    median         = np.full((nWeeks, 1), np.nan)
+    median[played] = np.nanmedian(actual[played], axis=1)[:,None]
+    record         = record + (actual > median)
+  record   = np.where(hasOpp & played[:,None], record, np.nan)
+  #-----------------------------------
+  # Transform into a single data frame.
+  #-----------------------------------
+  sheets     = {'Actual'               : actual,
+                'Projected'            : projected,
+                'Possible'             : np.full((nWeeks, nTeams), np.nan),
+                'Record'               : record,
+                'Matchup Differential' : np.round(diff, 2)}
+  all_sheets = []
+  for name, values in sheets.items():
+    sheet = pd.DataFrame(values, columns=teamOwnerList)
+    sheet.insert(0, 'Week', np.array(weeks))
+    sheet['Sheet'] = name
+    all_sheets.append(sheet)
+
+  leagueData = pd.concat(all_sheets)
+  leagueData.reset_index(inplace=True, drop=True)
+
+  return leagueData
+#----------------------------------------------------------------------
+# Contents of the HTML report, per section. Figures, captions and
+# tables are added by the analysis functions as they are produced.
+#----------------------------------------------------------------------
+HTML_SECTIONS = [('actual',       'Actual scores'),
+                 ('projected',    'Projected scores'),
+                 ('possible',     'Possible scores'),
+                 ('differential', 'Matchup point differential'),
+                 ('schedule',     'Schedule swaps'),
+                 ('kalman',       'Team strength outlook'),
+                 ('regression',   'Regression analysis'),
+                 ('snapshot',     'As-of-week snapshots')]
+htmlReport    = {section: [] for section, title in HTML_SECTIONS}
+#----------------------------------------------------------------------
+# Function to give the directory the figures are written to, i.e.,
+# next to the data set file, or LEAGUE/year when importing the league
+# data from Sleeper.
+# ----------
+# Arguments:
+# ----------
+# args      (object)  command line arguments
+# ----------
+# Returns:
+# ----------
+# directory (str)     figure directory
+#----------------------------------------------------------------------
+def figureDirectory(args):
+  if args.sleeper:
+    return LEAGUE + '/' + args.year
+
+  return "/".join(args.inputFile.split('/')[0:-1])
+#----------------------------------------------------------------------
+# Function to save the current figure. The .pdf is written for the
+# LaTeX report, and an in-memory .svg is kept for the HTML report.
+# ----------
+# Arguments:
+# ----------
+# a_Path    (str)     figure file path, without extension
+# a_Section (str)     HTML report section of the figure
+# args      (object)  command line arguments
+# a_Width   (float)   figure width as a fraction of the page width
+#----------------------------------------------------------------------
+def saveFigure(a_Path, a_Section, args, a_Width=0.9):
+  if args.html:
+    svg = io.StringIO()
+    plt.savefig(svg, format='svg', bbox_inches='tight')
+    htmlReport[a_Section].append({'figure': svg.getvalue(), 'width': a_Width})
+  if args.build or not args.html:
+    plt.savefig(a_Path + '.pdf', bbox_inches='tight', dpi=300)
+
+  return
+#----------------------------------------------------------------------
+# Function to write a figure caption to a texfile and to the HTML
+# report. The caption closes the group of figures preceding it.
+# ----------
+# Arguments:
+# ----------
+# a_Texfile (object)  open texfile
+# a_Section (str)     HTML report section of the caption
+# a_Caption (str)     caption, in LaTeX
+# args      (object)  command line arguments
+#----------------------------------------------------------------------
+def writeCaption(a_Texfile, a_Section, a_Caption, args):
+  a_Texfile.write('\\caption{' + a_Caption + '}\n')
+  if args.html:
+    htmlReport[a_Section].append({'caption': a_Caption})
+
+  return
+#----------------------------------------------------------------------
+# Function to add a table to the HTML report.
+# ----------
+# Arguments:
+# ----------
+# a_Section (str)     HTML report section of the table
+# a_Table   (str)     table, in HTML
+# a_Caption (str)     caption, in LaTeX
+# args      (object)  command line arguments
+#----------------------------------------------------------------------
+def addTable(a_Section, a_Table, a_Caption, args):
+  if args.html:
+    htmlReport[a_Section].append({'table': a_Table, 'caption': a_Caption})
+
+  return
+#----------------------------------------------------------------------
+# Series derived from the sheets by summaryStatistics, and the
+# quantiles (in percent) computed for every series, in addition to the
+# box plot whiskers.
+#----------------------------------------------------------------------
+SUMMARY_DERIVED   = ['Differential', 'Efficiency', 'Wins']
+SUMMARY_QUANTILES = [5, 25, 50, 75, 95]
+#----------------------------------------------------------------------
+# Function to list the series summarized by summaryStatistics: every
+# sheet of the league data, in order, followed by the derived series.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# ----------
+# Returns:
+# ----------
+# series          (list)    list of series names
+#----------------------------------------------------------------------
+def summarySeries(a_LeagueData):
+  return list(dict.fromkeys(a_LeagueData["Sheet"])) + SUMMARY_DERIVED
+#----------------------------------------------------------------------
+# Function to compute the summary statistics of every sheet and
+# derived series in a single pass. The derived series are
+# - Differential: actual score - projected score
+# - Efficiency:   actual score / possible score, in percent
+# - Wins:         1 for a matchup win, 0 otherwise (NaN if not played)
+# All series are stacked into one series x weeks x teams array so that
+# every statistic is a single call over the week axis. Weeks not yet
+# played (blank) are left out of every statistic.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# a_Whiskers      (list)    box plot whisker percentiles
+# ----------
+# Returns:
+# ----------
+# summary         (dict)    per series, the 'team' statistics (arrays
+#                           over teams) and 'league' statistics
+#                           (scalars) count of played weeks, mean, std,
+#                           min, max, total, CV and quantiles at the
+#                           'percents', as well as the 'data' itself
+#----------------------------------------------------------------------
+def summaryStatistics(a_LeagueData, a_TeamOwnerList, a_Whiskers):
+  percents = sorted(set(float(q) for q in SUMMARY_QUANTILES + list(a_Whiskers)))
+  series   = summarySeries(a_LeagueData)
+  sheets   = {}
+  for sheet in series[0:-len(SUMMARY_DERIVED)]:
+    sheets[sheet] = a_LeagueData.loc[a_LeagueData["Sheet"] == sheet, a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  nWeeks = sheets['Actual'].shape[0]
+  for sheet in sheets:
+    sheets[sheet] = sheets[sheet][0:nWeeks]
+  sheets['Differential'] = sheets['Actual'] - sheets['Projected']
+  sheets['Efficiency']   = sheets['Actual']/sheets['Possible']*100
+  sheets['Wins']         = np.where(np.isnan(sheets['Matchup Differential']), np.nan, sheets['Matchup Differential'] > 0)
+  #-----------------------------------------
+  # Stack series, series x weeks x teams, and
+  # compute all statistics at once.
+  #-----------------------------------------
+  data   = np.stack([sheets[name] for name in series])
+  league = data.reshape(len(series), -1)
+  #-------------------------------------------
+  # Series with no played week at all are NaN,
+  # without warnings.
+  #-------------------------------------------
+  with warnings.catch_warnings():
+    warnings.simplefilter('ignore', category=RuntimeWarning)
+    team  = {'count'     : np.sum(~np.isnan(data), axis=1),
+             'mean'      : np.nanmean(data, axis=1),
+             'std'       : np.nanstd(data, axis=1),
+             'min'       : np.nanmin(data, axis=1),
+             'max'       : np.nanmax(data, axis=1),
+             'total'     : np.nansum(data, axis=1),
+             'quantiles' : np.nanpercentile(data, percents, axis=1)}
+    total = {'count'     : np.sum(~np.isnan(league), axis=1),
+             'mean'      : np.nanmean(league, axis=1),
+             'std'       : np.nanstd(league, axis=1),
+             'min'       : np.nanmin(league, axis=1),
+             'max'       : np.nanmax(league, axis=1),
+             'total'     : np.nansum(league, axis=1),
+             'quantiles' : np.nanpercentile(league, percents, axis=1)}
+  #------------------------------------------
+  # CV is undefined for series with zero mean,
+  # such as the league's matchup differentials.
+  #------------------------------------------
+  with np.errstate(divide='ignore', invalid='ignore'):
+    team['CV']  = np.where(np.abs(team['mean']) > 1e-9*team['std'], team['std']/team['mean'], np.nan)
+    total['CV'] = np.where(np.abs(total['mean']) > 1e-9*total['std'], total['std']/total['mean'], np.nan)
+  #------------------------
+  # Split back into series.
+  #------------------------
+  summary = {}
+  for seriesID, name in enumerate(series):
+    summary[name] = {'data'     : data[seriesID],
+                     'percents' : percents,
+                     'team'     : {stat: (value[:,seriesID] if stat == 'quantiles' else value[seriesID]) for stat, value in team.items()},
+                     'league'   : {stat: (value[:,seriesID] if stat == 'quantiles' else value[seriesID]) for stat, value in total.items()}}
+
+  return summary
+#----------------------------------------------------------------------
+# Function to write the summary statistics to summary.json and
+# summary.csv, so they can be read without Excel or pandas.
+# ----------
+# Arguments:
+# ----------
+# a_Summary       (dict)    summary statistics from summaryStatistics
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def writeSummary(a_Summary, a_TeamOwnerList, args):
+  #----------------------------------------
+  # NaN (e.g., weeks not yet played) is not
+  # valid JSON, so it is written as null.
+  #----------------------------------------
+  def toList(a_Value):
+    return [None if np.isnan(value) else float(value) for value in np.atleast_1d(a_Value)]
+  def toQuantiles(a_Value):
+    return dict(zip(['{:g}'.format(q) for q in a_Summary['Actual']['percents']], [toList(row) for row in a_Value]))
+  #-----
+  # JSON.
+  #-----
+  output = {'teams'     : a_TeamOwnerList,
+            'weeks'     : int(a_Summary['Actual']['data'].shape[0]),
+            'quantiles' : a_Summary['Actual']['percents'],
+            'series'    : {}}
+  for series in a_Summary:
+    team   = a_Summary[series]['team']
+    league = a_Summary[series]['league']
+    output['series'][series] = {'team'   : {stat: toQuantiles(team[stat]) if stat == 'quantiles' else toList(team[stat]) for stat in team},
+                                'league'   : {stat: toQuantiles(league[stat][:,None]) if stat == 'quantiles' else toList(league[stat])[0] for stat in league}}
+  jsonfile = open(LEAGUE + '/' + args.year + '/summary.json', 'w')
+  json.dump(output, jsonfile, indent=1)
+  jsonfile.close()
+  #---------------------------------------
+  # CSV, one row per series, team and stat.
+  #---------------------------------------
+  csvfile = open(LEAGUE + '/' + args.year + '/summary.csv', 'w', newline='')
+  writer  = csv.writer(csvfile)
+  writer.writerow(['Series', 'Team', 'Statistic', 'Value'])
+  for series in a_Summary:
+    team   = a_Summary[series]['team']
+    league = a_Summary[series]['league']
+    for teamID, owner in enumerate(a_TeamOwnerList + ['League']):
+      for stat in team:
+        value = team[stat][..., teamID] if teamID < len(a_TeamOwnerList) else league[stat]
+        if stat == 'quantiles':
+          for q, quantile in zip(a_Summary[series]['percents'], value):
+            writer.writerow([series, owner, 'q' + '{:g}'.format(q), float(quantile)])
+        else:
+          writer.writerow([series, owner, stat, float(value)])
+  csvfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to assemble the box plot statistics of every team in a
+# series from its precomputed quantiles, for drawing with Axes.bxp.
+# Following matplotlib, whiskers extend to the most extreme data point
+# within the whisker percentiles (but at least to the box), and points
+# beyond are fliers. Only the weeks each team has played (non-NaN) are
+# used, with the quantiles of the summary statistics computed over the
+# same weeks.
+# ----------
+# Arguments:
+# ----------
+# a_Series        (dict)    summary statistics of the series, with the
+#                           'data', 'percents' and 'team' 'mean' and
+#                           'quantiles' as given by summaryStatistics
+# a_TeamOwnerList (list)    list of team owner names
+# a_Whiskers      (list)    box plot whisker percentiles
+# ----------
+# Returns:
+# ----------
+# boxStats        (list)    one dict of box plot statistics per team
+#----------------------------------------------------------------------
+def boxStatistics(a_Series, a_TeamOwnerList, a_Whiskers):
+  data      = a_Series['data']
+  played    = ~np.isnan(data)
+  quantiles = dict(zip(a_Series['percents'], a_Series['team']['quantiles']))
+  #--------------------------------------
+  # Snap whiskers to data, for all teams.
+  #--------------------------------------
+  whislo = np.minimum(np.min(np.where(played & (data >= quantiles[a_Whiskers[0]]), data, np.inf), axis=0), quantiles[25])
+  whishi = np.maximum(np.max(np.where(played & (data <= quantiles[a_Whiskers[1]]), data, -np.inf), axis=0), quantiles[75])
+  fliers = played & ((data < whislo) | (data > whishi))
+
+  boxStats = []
+  for teamID in range(0, len(a_TeamOwnerList)):
+    boxStats.append({'label'  : a_TeamOwnerList[teamID],
+                     'mean'   : a_Series['team']['mean'][teamID],
+                     'med'    : quantiles[50][teamID],
+                     'q1'     : quantiles[25][teamID],
+                     'q3'     : quantiles[75][teamID],
+                     'whislo' : whislo[teamID],
+                     'whishi' : whishi[teamID],
+                     'fliers' : data[fliers[:,teamID], teamID]})
+
+  return boxStats
+#----------------------------------------------------------------------
 # Example for box plot explanation.
 #
 # Adapted from Robert Wilson:
 # https://blog.rtwilson.com/automatically-annotating-a-boxplot-in-matplotlib/
 #----------------------------------------------------------------------
-def annotate_boxplot(bpdict, args, annotate_params=None,
+def annotate_boxplot(boxStats, args, annotate_params=None,
                      x_offset=0.05, x_loc=0,
                      text_offset_x=35,
                      text_offset_y=20):
   """Annotates a matplotlib boxplot with labels marking various centile levels.
 
   Parameters:
-  - bpdict: The dict returned from the matplotlib `boxplot` function. If you're using pandas you can
-  get this dict by setting `return_type='dict'` when calling `df.boxplot()`.
+  - boxStats: The list of box plot statistics drawn with the matplotlib `bxp` function, as returned by
+  `boxStatistics`.
   - annotate_params: Extra parameters for the plt.annotate function. The default setting uses standard arrows
   and offsets the text based on other parameters passed to the function
   - x_offset: The offset from the centre of the boxplot to place the heads of the arrows, in x axis
@@ -79,12 +595,13 @@ def annotate_boxplot(bpdict, args, annotate_params=None,
   if annotate_params is None:
       annotate_params = dict(xytext=(text_offset_x, text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'})
 
-#  plt.annotate('Median', (x_loc + 1 + x_offset, bpdict['medians'][x_loc].get_ydata()[0]), **annotate_params)
-#  plt.annotate('Mean', (x_loc + 1 + x_offset, bpdict['means'][x_loc].get_ydata()[0]), **dict(xytext=(text_offset_x+1, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
-  plt.annotate('25%', (x_loc + 1 + x_offset, bpdict['boxes'][x_loc].get_ydata()[0]), **dict(xytext=(text_offset_x, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
-  plt.annotate('75%', (x_loc + 1 + x_offset, bpdict['boxes'][x_loc].get_ydata()[2]), **annotate_params)
-  plt.annotate('5%', (x_loc + 1 + x_offset, bpdict['caps'][x_loc*2].get_ydata()[0]), **dict(xytext=(text_offset_x, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
-  plt.annotate('95%', (x_loc + 1 + x_offset, bpdict['caps'][(x_loc*2)+1].get_ydata()[0]), **annotate_params)
+  percent = '\\%' if plt.rcParams['text.usetex'] else '%'
+#  plt.annotate('Median', (x_loc + 1 + x_offset, boxStats[x_loc]['med']), **annotate_params)
+#  plt.annotate('Mean', (x_loc + 1 + x_offset, boxStats[x_loc]['mean']), **dict(xytext=(text_offset_x+1, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
+  plt.annotate('25' + percent, (x_loc + 1 + x_offset, boxStats[x_loc]['q1']), **dict(xytext=(text_offset_x, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
+  plt.annotate('75' + percent, (x_loc + 1 + x_offset, boxStats[x_loc]['q3']), **annotate_params)
+  plt.annotate('{:g}'.format(args.whis[0]) + percent, (x_loc + 1 + x_offset, boxStats[x_loc]['whislo']), **dict(xytext=(text_offset_x, -text_offset_y), textcoords='offset points', arrowprops={'arrowstyle':'->'}))
+  plt.annotate('{:g}'.format(args.whis[1]) + percent, (x_loc + 1 + x_offset, boxStats[x_loc]['whishi']), **annotate_params)
   
   plt.savefig(LEAGUE + '/' + args.year + '/figures/box_plot_example.pdf', dpi=300, bbox_inches='tight') 
 
@@ -97,9 +614,10 @@ def annotate_boxplot(bpdict, args, annotate_params=None,
 # a_LeagueData    (object)  pandas dataframe object for league data
 #                           given by .xls sheets
 # a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
 # args            (object)  command line arguments
 #----------------------------------------------------------------------
-def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
+def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
   #----------------------------------
   # Plot all the league data at once.
   #
@@ -127,6 +645,8 @@ def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   # Individual plot per team.
   #--------------------------
   print("Plotting team data for weekly actual scores...")
+  nWeeks = a_Summary['Actual']['data'].shape[0]
+  weeks  = np.linspace(1, nWeeks, nWeeks)
   #----------------
   # Create texfile.
   #----------------
@@ -138,15 +658,15 @@ def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\centering\n')
   for teamID in range(0, len(a_TeamOwnerList)):
     plt.figure() 
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Actual", a_TeamOwnerList[teamID]].to_numpy(), 'k.-')
-    plt.xticks(np.linspace(1,14,14)) 
-    plt.xlim([1,14])
+    plt.plot(weeks, a_Summary['Actual']['data'][:,teamID], 'k.-')
+    plt.xticks(weeks)
+    plt.xlim([1,nWeeks])
     plt.ylim([40,200])
     plt.grid(axis='y')
     plt.ylabel("Score", fontsize=14)
     plt.xlabel("Week", fontsize=14)
     plt.suptitle('Weekly scoring data for ' + a_TeamOwnerList[teamID], y=0.98, fontsize=18)
-    plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/actual/weekly_' + a_TeamOwnerList[teamID] + '.pdf', bbox_inches='tight', dpi=300)
+    saveFigure(figureDirectory(args) + '/figures/actual/weekly_' + a_TeamOwnerList[teamID], 'actual', args, a_Width=0.3)
     plt.close()
     #---------------------
     # Put plot in texfile.
@@ -156,30 +676,28 @@ def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
       texfile.write('\\\\')
     texfile.write('\n')
   
-  texfile.write('\\caption{Team scoring week-by-week.}\n')
+  writeCaption(texfile, 'actual', 'Team scoring week-by-week.', args)
   texfile.write('\\label{fig:Actual_Weekly_Team}\n')
   texfile.write('\\end{figure}\n\n')
     
   print("Finished plotting team data for weekly actual scores.\n")
-  #-------------------------------
-  # Compute the mean and variance.
-  #-------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())
+  #------------------------------------------
+  # League mean, from the summary statistics.
+  #------------------------------------------
+  mean_total = a_Summary['Actual']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting team score variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Actual'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.plot(np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)), mean_total*np.ones(len(a_TeamOwnerList)), 'k--', label='League mean')
   plt.ylabel("Score",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
   plt.ylim([40,200])
   plt.suptitle("Variance of team performances", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/actual/variance_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/actual/variance_all', 'actual', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -187,7 +705,7 @@ def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/actual/variance_all.pdf}\n')
-  texfile.write('\\caption{Variance of team performances over the duration of the season. Dashed black line indicates the league average score.}\n')
+  writeCaption(texfile, 'actual', 'Variance of team performances over the duration of the season. Dashed black line indicates the league average score.', args)
   texfile.write('\\end{figure}')
   texfile.close()
 
@@ -203,9 +721,10 @@ def actualScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
 # a_LeagueData    (object)  pandas dataframe object for league data
 #                           given by .xls sheets
 # a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
 # args            (object)  command line arguments
 #----------------------------------------------------------------------
-def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
+def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
   #----------------------------------
   # Plot all the league data at once.
   #
@@ -233,6 +752,8 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   # Individual plot per team.
   #--------------------------
   print("Plotting team data for weekly projected scores...")
+  nWeeks = a_Summary['Actual']['data'].shape[0]
+  weeks  = np.linspace(1, nWeeks, nWeeks)
   #----------------
   # Create texfile.
   #----------------
@@ -244,19 +765,19 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   #------------
   for teamID in range(0, len(a_TeamOwnerList)):
     plt.figure() 
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Projected", a_TeamOwnerList[teamID]].to_numpy(), 'k.-', label="Projected")
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Actual", a_TeamOwnerList[teamID]].to_numpy(), 'r.-', label="Actual")
+    plt.plot(weeks, a_Summary['Projected']['data'][:,teamID], 'k.-', label="Projected")
+    plt.plot(weeks, a_Summary['Actual']['data'][:,teamID], 'r.-', label="Actual")
     plt.legend(bbox_to_anchor=(0.867, 0.084), loc='center',\
                handlelength=1, fontsize=14,\
                edgecolor='k', framealpha=1.0)
-    plt.xticks(np.linspace(1,14,14)) 
-    plt.xlim([1,14])
+    plt.xticks(weeks)
+    plt.xlim([1,nWeeks])
     plt.ylim([40,200])
     plt.grid(axis='y')
     plt.ylabel("Score", fontsize=14)
     plt.xlabel("Week", fontsize=14)
     plt.suptitle('Projected vs. actual weekly scoring data for ' + a_TeamOwnerList[teamID], y=0.98, fontsize=18)
-    plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/projected/weekly_' + a_TeamOwnerList[teamID] + '.pdf', bbox_inches='tight', dpi=300)
+    saveFigure(figureDirectory(args) + '/figures/projected/weekly_' + a_TeamOwnerList[teamID], 'projected', args, a_Width=0.3)
     plt.close()
     #---------------------
     # Put plot in texfile.
@@ -266,30 +787,28 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
       texfile.write('\\\\')
     texfile.write('\n')
   
-  texfile.write('\\caption{Projected team scoring week-by-week. Black lines indicate the Sleeper projection generated pre-kickoffs, and red lines indicate the actual score.}\n')
+  writeCaption(texfile, 'projected', 'Projected team scoring week-by-week. Black lines indicate the Sleeper projection generated pre-kickoffs, and red lines indicate the actual score.', args)
   texfile.write('\\label{fig:Projected_Weekly_Team}\n')
   texfile.write('\\end{figure}\n\n')
     
   print("Finished plotting team data for weekly projected scores.\n")
-  #---------------------------------------------------
-  # Compute the mean and variance for projected scores.
-  #---------------------------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())
+  #--------------------------------------------------------------
+  # League mean of projected scores, from the summary statistics.
+  #--------------------------------------------------------------
+  mean_total = a_Summary['Projected']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting projected team score variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Projected'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.plot(np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)), mean_total*np.ones(len(a_TeamOwnerList)), 'k--', label='League mean')
   plt.ylabel("Projected score",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
   plt.ylim([60,120])
   plt.suptitle("Variance of projected team performances", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/projected/variance_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/projected/variance_all', 'projected', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -297,29 +816,27 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/projected/variance_all.pdf}\n')
-  texfile.write('\\caption{Variance of \textit{projected} team performances over the duration of the season. Dashed black line indicates the league average projected score.}\n')
+  writeCaption(texfile, 'projected', 'Variance of \\textit{projected} team performances over the duration of the season. Dashed black line indicates the league average projected score.', args)
   texfile.write('\\end{figure}\n\n')
 
   print("Finished plotting projected team score variance.\n")
-  #--------------------------------------------------------
-  # Compute the mean and variance for scores differentials.
-  #--------------------------------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy() - a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0) 
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy() - a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy() - a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())
+  #-----------------------------------------------------------------
+  # League mean of score differentials, from the summary statistics.
+  #-----------------------------------------------------------------
+  mean_total = a_Summary['Differential']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting team projected vs. actual variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy() - a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Differential'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.plot(np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)), mean_total*np.ones(len(a_TeamOwnerList)), 'k--', label='League mean')
   plt.ylabel("Point differential",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
   plt.ylim([-60,80])
   plt.suptitle("Variance of difference between team actual and projected score", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/projected/variance_differential_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/projected/variance_differential_all', 'projected', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -327,7 +844,7 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/projected/variance_differential_all.pdf}\n')
-  texfile.write('\\caption{Variance of \textit{projected} team performances subtracted from \textit{actual} team scores over the duration of the season. Dashed black line indicates the league average differential, which was positive over the season, meaning that on average everyone out-performed the Sleeper projection. A higher number indicates that a team out-performed projection, while a lower number indicates a team under-performed projection.}\n')
+  writeCaption(texfile, 'projected', 'Variance of \\textit{projected} team performances subtracted from \\textit{actual} team scores over the duration of the season. Dashed black line indicates the league average differential, which was positive over the season, meaning that on average everyone out-performed the Sleeper projection. A higher number indicates that a team out-performed projection, while a lower number indicates a team under-performed projection.', args)
   texfile.write('\\end{figure}')
   texfile.close()
 
@@ -343,9 +860,10 @@ def projectedScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
 # a_LeagueData    (object)  pandas dataframe object for league data
 #                           given by .xls sheets
 # a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
 # args            (object)  command line arguments
 #----------------------------------------------------------------------
-def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
+def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
   #----------------------------------
   # Plot all the league data at once.
   #
@@ -378,6 +896,8 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   # Individual plot per team.
   #--------------------------
   print("Plotting team data for weekly possible scores...")
+  nWeeks = a_Summary['Actual']['data'].shape[0]
+  weeks  = np.linspace(1, nWeeks, nWeeks)
   #----------------
   # Create texfile.
   #----------------
@@ -389,19 +909,19 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\centering\n')
   for teamID in range(0, len(a_TeamOwnerList)):
     plt.figure() 
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Possible", a_TeamOwnerList[teamID]].to_numpy(), 'k.-', label="Possible")
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Actual", a_TeamOwnerList[teamID]].to_numpy(), 'r.-', label="Actual")
+    plt.plot(weeks, a_Summary['Possible']['data'][:,teamID], 'k.-', label="Possible")
+    plt.plot(weeks, a_Summary['Actual']['data'][:,teamID], 'r.-', label="Actual")
     plt.legend(bbox_to_anchor=(0.88, 0.084), loc='center',\
                handlelength=1, fontsize=14,\
                edgecolor='k', framealpha=1.0)
-    plt.xticks(np.linspace(1,14,14)) 
-    plt.xlim([1,14])
+    plt.xticks(weeks)
+    plt.xlim([1,nWeeks])
     plt.ylim([40,200])
     plt.grid(axis='y')
     plt.ylabel("Score", fontsize=14)
     plt.xlabel("Week", fontsize=14)
     plt.suptitle('Possible vs. actual weekly scoring data for ' + a_TeamOwnerList[teamID], y=0.98, fontsize=18)
-    plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/possible/weekly_' + a_TeamOwnerList[teamID] + '.pdf', bbox_inches='tight', dpi=300)
+    saveFigure(figureDirectory(args) + '/figures/possible/weekly_' + a_TeamOwnerList[teamID], 'possible', args, a_Width=0.3)
     plt.close()
     #---------------------
     # Put plot in texfile.
@@ -411,30 +931,28 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
       texfile.write('\\\\')
     texfile.write('\n')
   
-  texfile.write('\\caption{Possible team scoring week-by-week. Black lines indicate the score given an optimal starting lineup, and red lines indicate the actual score.}\n')
+  writeCaption(texfile, 'possible', 'Possible team scoring week-by-week. Black lines indicate the score given an optimal starting lineup, and red lines indicate the actual score.', args)
   texfile.write('\\label{fig:Possible_Weekly_Team}\n')
   texfile.write('\\end{figure}\n\n')
 
   print("Finished plotting team data for weekly possible scores.\n")
-  #---------------------------------------------------
-  # Compute the mean and variance for possible scores.
-  #---------------------------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())
+  #-------------------------------------------------------------
+  # League mean of possible scores, from the summary statistics.
+  #-------------------------------------------------------------
+  mean_total = a_Summary['Possible']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting possible team score variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Possible'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.plot(np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)), mean_total*np.ones(len(a_TeamOwnerList)), 'k--', label='League mean')
   plt.ylabel("Possible score",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
   plt.ylim([40,200])
   plt.suptitle("Variance of possible team performances", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/possible/variance_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/possible/variance_all', 'possible', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -442,30 +960,29 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/possible/variance_all.pdf}\n')
-  texfile.write('\\caption{Variance of \textit{possible} team performances over the duration of the season. Dashed black line indicates the league average possible score.}\n')
+  writeCaption(texfile, 'possible', 'Variance of \\textit{possible} team performances over the duration of the season. Dashed black line indicates the league average possible score.', args)
   texfile.write('\\end{figure}\n\n')
 
   print("Finished plotting possible team score variance.\n")
-  #----------------------------------------------
-  # Compute the mean and variance for effiencies.
-  #----------------------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()/a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)*100 
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()/a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)*100
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()/a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())*100
+  #----------------------------------------------------------
+  # League mean of efficiencies, from the summary statistics.
+  #----------------------------------------------------------
+  mean_total = a_Summary['Efficiency']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting team efficiency variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()/a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()*100, showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Efficiency'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.plot(np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)), mean_total*np.ones(len(a_TeamOwnerList)), 'k--', label='League mean')
   plt.ylabel("Efficiency",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
-  plt.yticks([50,60,70,80,90,100],['50\%', '60\%', '70\%', '80\%', '90\%', '100\%'])
+  percent = '\\%' if plt.rcParams['text.usetex'] else '%'
+  plt.yticks([50,60,70,80,90,100],[str(tick) + percent for tick in [50,60,70,80,90,100]])
   plt.ylim([40,110])
   plt.suptitle("Variance of team efficiencies", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/possible/variance_efficiency_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/possible/variance_efficiency_all', 'possible', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -473,7 +990,7 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/possible/variance_efficiency_all.pdf}\n')
-  texfile.write('\\caption{Variance of team owner efficiency over the duration of the season, where $\\text{efficiency } = \\frac{\\text{Actual score}}{\\text{Possible score}}$. Dashed black line indicates the league average efficiency.}\n')
+  writeCaption(texfile, 'possible', 'Variance of team owner efficiency over the duration of the season, where $\\text{efficiency } = \\frac{\\text{Actual score}}{\\text{Possible score}}$. Dashed black line indicates the league average efficiency.', args)
   texfile.write('\\end{figure}')
   texfile.close()
 
@@ -489,13 +1006,16 @@ def possibleScoreAnalysis(a_LeagueData, a_TeamOwnerList, args):
 # a_LeagueData    (object)  pandas dataframe object for league data
 #                           given by .xls sheets
 # a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
 # args            (object)  command line arguments
 #----------------------------------------------------------------------
-def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
+def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
   #--------------------------
   # Individual plot per team.
   #--------------------------
   print("Plotting team data for weekly point differentials...")
+  nWeeks = a_Summary['Actual']['data'].shape[0]
+  weeks  = np.linspace(1, nWeeks, nWeeks)
   #----------------
   # Create texfile.
   #----------------
@@ -507,15 +1027,15 @@ def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\centering\n')
   for teamID in range(0, len(a_TeamOwnerList)):
     plt.figure() 
-    plt.plot(np.linspace(1, 14, 14), a_LeagueData.loc[leagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[teamID]].to_numpy(), 'k.-')
-    plt.xticks(np.linspace(1,14,14)) 
-    plt.xlim([1,14])
+    plt.plot(weeks, a_Summary['Matchup Differential']['data'][:,teamID], 'k.-')
+    plt.xticks(weeks)
+    plt.xlim([1,nWeeks])
     plt.ylim([-80,100])
     plt.grid(axis='y')
     plt.ylabel("Point differential", fontsize=14)
     plt.xlabel("Week", fontsize=14)
     plt.suptitle('Weekly matchup point differentials for ' + a_TeamOwnerList[teamID], y=0.98, fontsize=18)
-    plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/differential/weekly_' + a_TeamOwnerList[teamID] + '.pdf', bbox_inches='tight', dpi=300)
+    saveFigure(figureDirectory(args) + '/figures/differential/weekly_' + a_TeamOwnerList[teamID], 'differential', args, a_Width=0.3)
     plt.close()
     #---------------------
     # Put plot in texfile.
@@ -525,29 +1045,27 @@ def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
       texfile.write('\\\\')
     texfile.write('\n')
   
-  texfile.write('\\caption{Point differentials in weekly matchups for each team.}\n')
+  writeCaption(texfile, 'differential', 'Point differentials in weekly matchups for each team.', args)
   texfile.write('\\label{fig:Differential_Weekly_Team}\n')
   texfile.write('\\end{figure}\n\n')
     
   print("Finished plotting team data for weekly point differentials.\n")
-  #-------------------------------
-  # Compute the mean and variance.
-  #-------------------------------
-  mean_team  = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  std_team   = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  mean_total = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy())
+  #------------------------------------------
+  # League mean, from the summary statistics.
+  #------------------------------------------
+  mean_total = a_Summary['Matchup Differential']['league']['mean']
   #-------------------------
   # Make box plots per week.
   #-------------------------
   print("Plotting team matchup differential variance...")
   plt.figure()
-  plt.boxplot(a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), showmeans=True)
+  plt.gca().bxp(boxStatistics(a_Summary['Matchup Differential'], a_TeamOwnerList, args.whis), showmeans=True)
   plt.ylabel("Matchup point differential",fontsize=16)
   plt.xlabel("Team",fontsize=16)
   plt.xticks(ticks=np.linspace(1, len(a_TeamOwnerList), len(a_TeamOwnerList)),labels=a_LeagueData.columns.to_list()[1:-1])
   plt.ylim([-80,80])
   plt.suptitle("Variance of team matchup point differentials", y=0.98, fontsize=18) 
-  plt.savefig("/".join(args.inputFile.split('/')[0:-1]) + '/figures/differential/variance_all.pdf', bbox_inches='tight', dpi=300)
+  saveFigure(figureDirectory(args) + '/figures/differential/variance_all', 'differential', args)
   plt.close()
   #---------------------
   # Put plot in texfile.
@@ -555,7 +1073,7 @@ def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile.write('\\begin{figure}[htb!]\n')
   texfile.write('\\centering\n')
   texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/differential/variance_all.pdf}\n')
-  texfile.write('\\caption{Variance of point differentials in weekly matchups over the duration of the season.}\n')
+  writeCaption(texfile, 'differential', 'Variance of point differentials in weekly matchups over the duration of the season.', args)
   texfile.write('\\end{figure}')
   texfile.close()
 
@@ -563,6 +1081,131 @@ def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
 
   return
 #----------------------------------------------------------------------
+# Function to compute every team's record under every other team's
+# schedule. Opponent scores are reconstructed from
+#
+#   opponent score = actual score - matchup differential
+#
+# and the whole N x N matrix is evaluated at once over a
+# teams x teams x weeks array. If team i plays team j's schedule and
+# team j's opponent in a given week was team i itself, team i faces
+# team j in that week instead.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# ----------
+# Returns:
+# ----------
+# wins            (array)   N x N array, where wins[i,j] is the number
+#                           of wins of team i playing team j's schedule
+#----------------------------------------------------------------------
+def scheduleSwapMatrix(a_LeagueData, a_TeamOwnerList):
+  #----------------------------------------
+  # Scores and differentials, teams x weeks.
+  #----------------------------------------
+  actual = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float).T
+  diff   = a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float).T
+  diff   = diff[:, 0:actual.shape[1]]
+  opp    = actual - diff
+  #------------------------------------------------------------
+  # Identify opponents: team k was team j's opponent in week w
+  # if k scored what j's opponent scored and the differentials
+  # cancel, i.e., isOpp[j,k,w].
+  #------------------------------------------------------------
+  isOpp  = np.isclose(actual[None,:,:], opp[:,None,:]) & np.isclose(diff[None,:,:], -diff[:,None,:])
+  isOpp &= ~np.eye(len(a_TeamOwnerList), dtype=bool)[:,:,None]
+  #--------------------------------------------------------------
+  # Opponent score of team i playing team j's schedule, swapping
+  # in team j whenever team j's opponent was team i.
+  #--------------------------------------------------------------
+  swapOpp = np.where(isOpp.transpose(1,0,2), actual[None,:,:], opp[None,:,:])
+  wins    = np.sum(actual[:,None,:] > swapOpp, axis=2)
+
+  return wins
+#----------------------------------------------------------------------
+# Function to analyze and plot the records every team would have had
+# under every other team's schedule, as well as the resulting strength
+# of schedule.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def scheduleSwapAnalysis(a_LeagueData, a_TeamOwnerList, args):
+  print("Computing schedule swap matrix...")
+  nTeams = len(a_TeamOwnerList)
+  wins   = scheduleSwapMatrix(a_LeagueData, a_TeamOwnerList)
+  #-----------------------------------------------------------
+  # Strength of schedule: the average number of wins the other
+  # teams would have had with a given team's schedule (fewer
+  # wins indicates a harder schedule).
+  #-----------------------------------------------------------
+  offDiag   = ~np.eye(nTeams, dtype=bool)
+  record    = np.diag(wins)
+  expected  = np.sum(wins*offDiag, axis=1)/(nTeams - 1)
+  SoS       = np.sum(wins*offDiag, axis=0)/(nTeams - 1)
+  SoSRank   = stats.rankdata(SoS, method='min').astype(int)
+  print("Finished computing schedule swap matrix.\n")
+  #-------------
+  # Make heatmap.
+  #-------------
+  print("Plotting schedule swap matrix...")
+  plt.figure(figsize=(8,7))
+  plt.imshow(wins, cmap='RdYlGn')
+  for i in range(0, nTeams):
+    for j in range(0, nTeams):
+      plt.text(j, i, str(wins[i,j]), ha='center', va='center', fontweight='bold' if i == j else 'normal')
+  plt.colorbar(label='Wins', fraction=0.046, pad=0.04)
+  plt.xticks(ticks=np.arange(nTeams), labels=a_TeamOwnerList, rotation=45)
+  plt.yticks(ticks=np.arange(nTeams), labels=a_TeamOwnerList)
+  plt.ylabel("Team",fontsize=16)
+  plt.xlabel("Schedule",fontsize=16)
+  plt.suptitle("Team records under every schedule", y=0.98, fontsize=18)
+  saveFigure(figureDirectory(args) + '/figures/schedule/swap_matrix', 'schedule', args)
+  plt.close()
+  #----------------
+  # Create texfile.
+  #----------------
+  texfile = open(LEAGUE + '/' + args.year + '/schedule_swap.tex', 'w')
+  texfile.write('\\begin{figure}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/schedule/swap_matrix.pdf}\n')
+  writeCaption(texfile, 'schedule', 'Number of wins each team (rows) would have had playing each team\'s schedule (columns). The diagonal, in bold, is each team\'s actual record.', args)
+  texfile.write('\\label{fig:Schedule_Swap}\n')
+  texfile.write('\\end{figure}\n\n')
+  #-------------------------------------------
+  # Strength of schedule table, hardest first.
+  #-------------------------------------------
+  texfile.write('\\begin{table}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\begin{tabular}{lcccc}\n')
+  texfile.write('\\toprule\n')
+  texfile.write('Team & Wins & Avg. wins (other schedules) & Opp. avg. wins (own schedule) & SoS rank \\\\\n')
+  texfile.write('\\midrule\n')
+  table = '<table>\n<tr><th>Team</th><th>Wins</th><th>Avg. wins (other schedules)</th><th>Opp. avg. wins (own schedule)</th><th>SoS rank</th></tr>\n'
+  for teamID in np.argsort(SoS, kind='stable'):
+    texfile.write(a_TeamOwnerList[teamID] + ' & ' + str(record[teamID]) + ' & ' + '{:.2f}'.format(expected[teamID]) + ' & ' + '{:.2f}'.format(SoS[teamID]) + ' & ' + str(SoSRank[teamID]) + ' \\\\\n')
+    table += '<tr><td>' + html.escape(a_TeamOwnerList[teamID]) + '</td><td>' + str(record[teamID]) + '</td><td>' + '{:.2f}'.format(expected[teamID]) + '</td><td>' + '{:.2f}'.format(SoS[teamID]) + '</td><td>' + str(SoSRank[teamID]) + '</td></tr>\n'
+  table += '</table>\n'
+  texfile.write('\\bottomrule\n')
+  texfile.write('\\end{tabular}\n')
+  caption = 'Strength of schedule (SoS), ordered from hardest to easiest schedule. SoS is measured by the average number of wins every other team would have had with a given team\'s schedule.'
+  texfile.write('\\caption{' + caption + '}\n')
+  addTable('schedule', table, caption, args)
+  texfile.write('\\label{tab:Schedule_Swap}\n')
+  texfile.write('\\end{table}')
+  texfile.close()
+
+  print("Finished plotting schedule swap matrix.\n")
+
+  return
+#----------------------------------------------------------------------
 # Function to compute correlations between the following:
 # - Total PF and record
 # - Weekly PF variance and record
@@ -573,33 +1216,34 @@ def pointDifferentialAnalysis(a_LeagueData, a_TeamOwnerList, args):
 # a_LeagueData    (object)  pandas dataframe object for league data
 #                           given by .xls sheets
 # a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
 # args            (object)  command line arguments
 #----------------------------------------------------------------------
-def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
+def regressionAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
+  #----------------------------------------------
+  # Season totals are not known until every week
+  # has been played; --as-of-week covers that case.
+  #----------------------------------------------
+  if np.any(np.isnan(a_Summary['Actual']['data'])):
+    print("Season not complete, skipping regression analysis (see --as-of-week).\n")
+    return
   #--------------------------------------------
   # Determine each team's total number of wins.
   #--------------------------------------------
   if 'Geed' in a_LeagueData.columns.to_list():
-    diff            = a_LeagueData.loc[a_LeagueData['Sheet'] == 'Matchup Differential', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()
-    diff[diff > 0]  = 1
-    diff[diff <= 0] = 0
-    record          = np.sum(diff, axis=0)
-    record_Median   = np.sum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+    record        = a_Summary['Wins']['team']['total']
+    record_Median = a_Summary['Record']['team']['total']
   else:
-    record   = np.sum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+    record   = a_Summary['Record']['team']['total']
   #----------------------------------------
   # Determine total PF actual and possible.
   #----------------------------------------
-  totalPF   = np.sum(a_LeagueData.loc[leagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  totalPF   = a_Summary['Actual']['team']['total']
   #-------------------------------------------------------
   # Determine coefficient of variance of every team, i.e.,
   # CoV = deviation of team score / average of team score
   #-------------------------------------------------------
-  CV   = np.zeros(len(a_TeamOwnerList))
-  mean = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  std  = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
-  for teamID in range(0, len(a_TeamOwnerList)):
-    CV[teamID] = std[teamID]/mean[teamID]
+  CV        = a_Summary['Actual']['team']['CV']
   #---------------------------------------------------------------------------
   # Generate new data frame for statistical analysis for measures of interest.
   #---------------------------------------------------------------------------
@@ -620,13 +1264,15 @@ def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile = open(LEAGUE + '/' + args.year + '/regression_RPF.tex', 'r')
   lines = texfile.readlines()
   lines.insert(0, '\\begin{table}[htb!]\n')
-  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and team total points (PF).}\n'
+  caption = 'Ordinary least-squares regression analysis of correlation between team record and team total points (PF).'
+  lines[29] = '\\caption{' + caption + '}\n'
   lines = lines[0:-4]
   lines.insert(-1, '\\end{table}\n')
   texfile.close()
   texfile = open(LEAGUE + '/' + args.year + '/regression_RPF.tex', 'w')
   texfile.writelines(lines)
   texfile.close()
+  addTable('regression', result_PF.summary().as_html(), caption, args)
   #-------------------------------------
   # Perform regression of CV vs. record.
   #-------------------------------------
@@ -643,13 +1289,15 @@ def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile = open(LEAGUE + '/' + args.year + '/regression_RCV.tex', 'r')
   lines = texfile.readlines()
   lines.insert(0, '\\begin{table}[htb!]\n')
-  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and team points correlation of variation (CV).}\n'
+  caption = 'Ordinary least-squares regression analysis of correlation between team record and team points correlation of variation (CV).'
+  lines[29] = '\\caption{' + caption + '}\n'
   lines = lines[0:-2]
   lines.insert(-1, '\\end{table}\n')
   texfile.close()
   texfile = open(LEAGUE + '/' + args.year + '/regression_RCV.tex', 'w')
   texfile.writelines(lines)
   texfile.close()
+  addTable('regression', result_CV.summary().as_html(), caption, args)
   #------------------------------------------
   # Perform regression of CV + PF vs. record.
   #------------------------------------------
@@ -666,13 +1314,15 @@ def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile = open(LEAGUE + '/' + args.year + '/regression_RPFCV.tex', 'r')
   lines = texfile.readlines()
   lines.insert(0, '\\begin{table}[htb!]\n')
-  lines[31] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and interaction between team total points (PF) and team correlation of variation of points (CV).}\n'
+  caption = 'Ordinary least-squares regression analysis of correlation between team record and interaction between team total points (PF) and team correlation of variation of points (CV).'
+  lines[31] = '\\caption{' + caption + '}\n'
   lines = lines[0:-4]
   lines.insert(-1, '\\end{table}')
   texfile.close()
   texfile = open(LEAGUE + '/' + args.year + '/regression_RPFCV.tex', 'w')
   texfile.writelines(lines)
   texfile.close()
+  addTable('regression', result_Correlation.summary().as_html(), caption, args)
   #---------------------------------
   # Perform regression of CV vs. PF.
   #---------------------------------
@@ -689,13 +1339,15 @@ def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
   texfile = open(LEAGUE + '/' + args.year + '/regression_PFCV.tex', 'r')
   lines = texfile.readlines()
   lines.insert(0, '\\begin{table}[htb!]\n')
-  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team total points (CF) and team points correlation of variation (CV).}\n'
+  caption = 'Ordinary least-squares regression analysis of correlation between team total points (CF) and team points correlation of variation (CV).'
+  lines[29] = '\\caption{' + caption + '}\n'
   lines = lines[0:-2]
   lines.insert(-1, '\\end{table}\n')
   texfile.close()
   texfile = open(LEAGUE + '/' + args.year + '/regression_PFCV.tex', 'w')
   texfile.writelines(lines)
   texfile.close()
+  addTable('regression', result_CVPF.summary().as_html(), caption, args)
   #----------------------------------------------------------
   # Perform regression of CV + PF vs. record for median wins.
   #----------------------------------------------------------
@@ -714,60 +1366,1716 @@ def regressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
     texfile = open(LEAGUE + '/' + args.year + '/regression_MRPFCV.tex', 'r')
     lines = texfile.readlines()
     lines.insert(0, '\\begin{table}[htb!]')
-    lines[31] = '\\caption{Ordinary least-squares regression analysis of correlation between team record \\textbf{using \\textit{median} wins} and interaction between team points and coefficient of variation of team points.}\n'
+    caption = 'Ordinary least-squares regression analysis of correlation between team record \\textbf{using \\textit{median} wins} and interaction between team points and coefficient of variation of team points.'
+    lines[31] = '\\caption{' + caption + '}\n'
     lines = lines[0:-4]
     lines.insert(-1, '\\end{table}')
     texfile.close()
     texfile = open(LEAGUE + '/' + args.year + '/regression_MRPFCV.tex', 'w')
     texfile.writelines(lines)
     texfile.close()
+    addTable('regression', resultMedian.summary().as_html(), caption, args)
 
   return
+#----------------------------------------------------------------------
+# Function to compute the season statistics as of every week at once.
+# Prefix sums and prefix sums of squares over the week axis give the
+# mean, deviation, CV, PF and record after week k for every k in
+# O(weeks x teams). Scores are shifted by the season mean of each team
+# before squaring to avoid cancellation in the variance. Weeks not yet
+# played (blank) are left out of the sums and the counts of weeks.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# ----------
+# Returns:
+# ----------
+# snapshots       (dict)    weeks x teams arrays of the statistics,
+#                           where row k holds the statistics after
+#                           week k+1, and the weeks every team played
+#----------------------------------------------------------------------
+def snapshotStatistics(a_LeagueData, a_TeamOwnerList):
+  actual = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  nWeeks = actual.shape[0]
+  played = ~np.isnan(actual)
+  counts = np.cumsum(played, axis=0)
+  #---------------------------------------
+  # Prefix sums of shifted scores and their
+  # squares over the week axis.
+  #---------------------------------------
+  shift = np.nansum(actual, axis=0)/np.maximum(np.sum(played, axis=0), 1)
+  S1    = np.nancumsum(actual - shift, axis=0)
+  S2    = np.nancumsum((actual - shift)**2, axis=0)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    mean = np.where(counts > 0, shift + S1/counts, np.nan)
+    std  = np.where(counts > 0, np.sqrt(np.maximum(S2/counts - (S1/counts)**2, 0)), np.nan)
+  #-----------------------------------------
+  # A single score has no deviation, rather
+  # than the rounding left by the prefix sums.
+  #-----------------------------------------
+  std[counts == 1] = 0
+  #------------------------------------------------
+  # Running records, following regressionAnalysis.
+  #------------------------------------------------
+  if 'Geed' in a_LeagueData.columns.to_list():
+    diff         = a_LeagueData.loc[a_LeagueData['Sheet'] == 'Matchup Differential', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+    record       = np.cumsum(diff[0:nWeeks] > 0, axis=0)
+    recordMedian = np.nancumsum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)[0:nWeeks], axis=0)
+  else:
+    record       = np.nancumsum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)[0:nWeeks], axis=0)
+    recordMedian = None
 
-#-------------
-# Main script.
-#------------- 
-if __name__ == '__main__':
-  #-----------------
-  # Set LaTeX fonts.
-  #-----------------
-  plt.rc('text', usetex=True)
-  plt.rc('font', family='serif')
-  #---------------------------
-  # Read command line options.
-  #---------------------------
-  parser = argparse.ArgumentParser(description='This file is used to generate plots related\
-                                                to the fantasy football league data for the\
-                                                "LEAGUE Squad" league. Report generation is optional.')
-  parser.add_argument('inputFile', metavar='i', type=str,
-                      help='the file path to the data set file')
-  parser.add_argument('year', metavar='y', type=str,
-                      help='the season to analyze')
-  parser.add_argument('--all', action='store_true',
-                      help='flag to make all plots')
-  parser.add_argument('--a', action='store_true',
-                      help='flag to make plots for actual scores')
-  parser.add_argument('--pr', action='store_true',
-                      help='flag to make plots for projected scores')
-  parser.add_argument('--po', action='store_true',
-                      help='flag to make plots for possible scores')
-  parser.add_argument('--d', action='store_true',
-                      help='flag to make plots for matchup differentials')
-  parser.add_argument('--r', action='store_true',
-                      help='flag to perform regression analysis of league data')
-  parser.add_argument('--print', action='store_true',
-                      help='flag to execute print statements')
-  parser.add_argument('--build', action='store_true',
-                      help='flag to build LaTeX report')
-  
-  args = parser.parse_args()
-  #-----------------------------
-  # Check environment variables.
-  #-----------------------------
-  try:
-    LEAGUE = os.environ['LEAGUE']
+  snapshots = {'week'         : np.arange(1, nWeeks + 1),
+               'played'       : np.all(played, axis=1),
+               'mean'         : mean,
+               'std'          : std,
+               'CV'           : std/mean,
+               'PF'           : shift*counts + S1,
+               'record'       : record,
+               'recordMedian' : recordMedian}
+
+  return snapshots
+#----------------------------------------------------------------------
+# Function to fit an ordinary least-squares model for every snapshot
+# at once. The normal equations of all snapshots are assembled and
+# solved as stacked arrays. Snapshots with missing (NaN) values are
+# not fitted, and their results are NaN.
+# ----------
+# Arguments:
+# ----------
+# a_Y      (array)   snapshots x teams dependent variable
+# a_X      (list)    list of snapshots x teams independent variables
+# ----------
+# Returns:
+# ----------
+# fit      (dict)    coefficients, t-values, p-values (snapshots x
+#                    terms, intercept first) and R^2 (snapshots)
+#----------------------------------------------------------------------
+def snapshotRegression(a_Y, a_X):
+  nSnapshots, nTeams = a_Y.shape
+  X     = np.stack([np.ones((nSnapshots, nTeams))] + list(a_X), axis=2)
+  valid = np.all(np.isfinite(X), axis=(1,2)) & np.all(np.isfinite(a_Y), axis=1)
+  #---------------------------------------
+  # Residual degrees of freedom from the
+  # rank of the design, as in statsmodels.
+  #---------------------------------------
+  rank        = np.zeros(nSnapshots, dtype=int)
+  rank[valid] = np.linalg.matrix_rank(X[valid])
+  nDOF        = nTeams - rank
+  #-------------------------------
+  # Solve the normal equations for
+  # every complete snapshot.
+  #-------------------------------
+  XtXinv        = np.full((nSnapshots, X.shape[2], X.shape[2]), np.nan)
+  XtXinv[valid] = np.linalg.pinv(np.einsum('kni,knj->kij', X[valid], X[valid]))
+  coef   = np.einsum('kij,kj->ki', XtXinv, np.einsum('kni,kn->ki', X, a_Y))
+  resid  = a_Y - np.einsum('kni,ki->kn', X, coef)
+  SSR    = np.sum(resid**2, axis=1)
+  SST    = np.sum((a_Y - np.mean(a_Y, axis=1)[:,None])**2, axis=1)
+  #------------------------------------
+  # Standard errors and t-test of every
+  # coefficient.
+  #------------------------------------
+  with np.errstate(divide='ignore', invalid='ignore'):
+    R2     = 1 - SSR/SST
+    stdErr = np.sqrt(np.maximum(SSR/nDOF, 0)[:,None]*np.diagonal(XtXinv, axis1=1, axis2=2))
+    tValue = np.where(stdErr > 0, coef/stdErr, np.nan)
+  pValue = 2*stats.t.sf(np.abs(tValue), nDOF[:,None])
+
+  return {'coef': coef, 't': tValue, 'p': pValue, 'R2': R2}
+#----------------------------------------------------------------------
+# Function to write the as-of-week snapshots of the season statistics
+# and regressions. All snapshots are computed in a single pass, and
+# only the requested ones are written.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# a_Weeks         (list)    weeks to write snapshots for, or None for
+#                           every played week
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def snapshotAnalysis(a_LeagueData, a_TeamOwnerList, a_Weeks, args):
+  print("Computing as-of-week snapshots...")
+  snapshots = snapshotStatistics(a_LeagueData, a_TeamOwnerList)
+  played    = [int(week) for week in snapshots['week'][snapshots['played']]]
+  if not played:
+    sys.exit("ERROR. No week has been played yet.")
+  if a_Weeks is None:
+    a_Weeks = played
+  for week in a_Weeks:
+    if week not in played:
+      sys.exit("-------------------\nCOMMAND LINE ERROR:\n-------------------\nSnapshot week must be a played week between " + str(played[0]) + " and " + str(played[-1]) + ".")
+  #-------------------------------------------
+  # Regressions of every snapshot, mirroring
+  # the tables of regressionAnalysis.
+  #-------------------------------------------
+  PF, CV, record = snapshots['PF'], snapshots['CV'], snapshots['record']
+  models = [('Record $\\sim$ PF',           ['PF'],                snapshotRegression(record, [PF])),
+            ('Record $\\sim$ CV',           ['CV'],                snapshotRegression(record, [CV])),
+            ('Record $\\sim$ PF + CV + PF:CV', ['PF', 'CV', 'PF:CV'], snapshotRegression(record, [PF, CV, PF*CV])),
+            ('PF $\\sim$ CV',               ['CV'],                snapshotRegression(PF, [CV]))]
+  print("Finished computing as-of-week snapshots.\n")
+  #---------------------------------
+  # Write a texfile for every week.
+  #---------------------------------
+  print("Writing as-of-week snapshots...")
+  for week in a_Weeks:
+    k = week - 1
+    texfile = open(LEAGUE + '/' + args.year + '/snapshot_week' + str(week) + '.tex', 'w')
+    texfile.write('\\subsection{After week ' + str(week) + '}\n')
+    #------------------------
+    # Team statistics table.
+    #------------------------
+    texfile.write('\\begin{table}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\begin{tabular}{lccccc}\n')
+    texfile.write('\\toprule\n')
+    texfile.write('Team & Record & PF & Mean & Deviation & CV \\\\\n')
+    texfile.write('\\midrule\n')
+    table = '<table>\n<tr><th>Team</th><th>Record</th><th>PF</th><th>Mean</th><th>Deviation</th><th>CV</th></tr>\n'
+    for teamID in range(0, len(a_TeamOwnerList)):
+      row = [str(int(record[k,teamID])), '{:.2f}'.format(PF[k,teamID]), '{:.2f}'.format(snapshots['mean'][k,teamID]), '{:.2f}'.format(snapshots['std'][k,teamID]), '{:.3f}'.format(CV[k,teamID])]
+      texfile.write(a_TeamOwnerList[teamID] + ' & ' + ' & '.join(row) + ' \\\\\n')
+      table += '<tr><td>' + html.escape(a_TeamOwnerList[teamID]) + '</td><td>' + '</td><td>'.join(row) + '</td></tr>\n'
+    table += '</table>\n'
+    texfile.write('\\bottomrule\n')
+    texfile.write('\\end{tabular}\n')
+    caption = 'Team statistics after week ' + str(week) + '.'
+    texfile.write('\\caption{' + caption + '}\n')
+    texfile.write('\\end{table}\n\n')
+    addTable('snapshot', table, caption, args)
+    #-------------------
+    # Regression table.
+    #-------------------
+    texfile.write('\\begin{table}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\begin{tabular}{llcccc}\n')
+    texfile.write('\\toprule\n')
+    texfile.write('Model & Term & Coef. & $t$ & $P>|t|$ & $R^2$ \\\\\n')
+    texfile.write('\\midrule\n')
+    table = '<table>\n<tr><th>Model</th><th>Term</th><th>Coef.</th><th>t</th><th>P&gt;|t|</th><th>R<sup>2</sup></th></tr>\n'
+    for name, terms, fit in models:
+      for termID in range(0, len(terms)):
+        row = [name if termID == 0 else '', terms[termID], '{:.4g}'.format(fit['coef'][k,termID+1]), '{:.3f}'.format(fit['t'][k,termID+1]), '{:.3f}'.format(fit['p'][k,termID+1]), '{:.3f}'.format(fit['R2'][k]) if termID == 0 else '']
+        texfile.write(' & '.join(row) + ' \\\\\n')
+        table += '<tr><td>' + '</td><td>'.join([texToHTML(entry) for entry in row]) + '</td></tr>\n'
+    table += '</table>\n'
+    texfile.write('\\bottomrule\n')
+    texfile.write('\\end{tabular}\n')
+    caption = 'Ordinary least-squares regressions of the season statistics after week ' + str(week) + '.'
+    texfile.write('\\caption{' + caption + '}\n')
+    texfile.write('\\end{table}\n')
+    texfile.close()
+    addTable('snapshot', table, caption, args)
+  #-------------------------------------------
+  # Collect the snapshots in a single texfile.
+  #-------------------------------------------
+  texfile = open(LEAGUE + '/' + args.year + '/snapshots.tex', 'w')
+  #-------------------------------------------
+  # Plot the evolution of the regressions over
+  # the season, if more than one snapshot.
+  #-------------------------------------------
+  if len(a_Weeks) > 1:
+    plt.figure()
+    for name, terms, fit in models:
+      plt.plot(a_Weeks, fit['R2'][np.array(a_Weeks) - 1], '.-', label=name)
+    plt.legend(loc='upper left', handlelength=1, fontsize=10, edgecolor='k', framealpha=1.0)
+    plt.xticks(a_Weeks)
+    plt.xlim([a_Weeks[0], a_Weeks[-1]])
+    plt.ylim([0,1])
+    plt.grid(axis='y')
+    plt.ylabel("$R^2$", fontsize=14)
+    plt.xlabel("Week", fontsize=14)
+    plt.suptitle('Evolution of regression fits', y=0.98, fontsize=18)
+    saveFigure(figureDirectory(args) + '/figures/snapshot/regression_evolution', 'snapshot', args)
+    plt.close()
+    texfile.write('\\begin{figure}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/snapshot/regression_evolution.pdf}\n')
+    writeCaption(texfile, 'snapshot', 'Coefficient of determination ($R^2$) of the regression models using the season statistics as of each week.', args)
+    texfile.write('\\end{figure}\n\n')
+    texfile.write('\\clearpage\n')
+  for week in a_Weeks:
+    texfile.write('\\input{snapshot_week' + str(week) + '.tex}\n')
+    texfile.write('\\clearpage\n')
+  texfile.close()
+
+  print("Finished writing as-of-week snapshots.\n")
+
+  return
+#----------------------------------------------------------------------
+# Function to run a local-level Kalman filter,
+#
+#   x_t = x_{t-1} + w_t,   w_t ~ N(0, Q)
+#   y_t = x_t     + v_t,   v_t ~ N(0, R)
+#
+# over the weeks of a_Y, for all teams (and all parameter values)
+# stacked in the trailing axes. Weeks with missing (NaN) scores only
+# advance the prediction.
+# ----------
+# Arguments:
+# ----------
+# a_Y      (array)   weeks x ... observed scores
+# a_X      (array)   filtered state before the first week
+# a_P      (array)   filtered state variance before the first week
+# a_Q      (array)   process noise variance
+# a_R      (array)   observation noise variance
+# a_Seen   (array)   whether each team was observed before the first
+#                    week, when continuing a previous run
+# ----------
+# Returns:
+# ----------
+# x        (array)   filtered state after the last week
+# P        (array)   filtered state variance after the last week
+# SSE      (array)   sum of squared standardized innovations, and
+# logF     (array)   sum of log innovation variances, both excluding
+#                    each team's first observed week
+# nObs     (array)   number of innovations in SSE and logF
+# seen     (array)   whether each team has been observed
+#----------------------------------------------------------------------
+def kalmanFilter(a_Y, a_X, a_P, a_Q, a_R, a_Seen=False):
+  x, P = a_X, a_P
+  SSE  = np.zeros(np.broadcast(a_X, a_Q).shape)
+  logF = np.zeros(SSE.shape)
+  nObs = np.zeros(SSE.shape)
+  seen = np.zeros(SSE.shape, dtype=bool) | a_Seen
+  for y in a_Y:
+    #---------
+    # Predict.
+    #---------
+    P = P + a_Q
+    F = P + a_R
+    #--------
+    # Update.
+    #--------
+    observed = ~np.isnan(y)
+    e        = np.where(observed, y - x, 0)
+    K        = np.where(observed, P/F, 0)
+    x        = x + K*e
+    P        = (1 - K)*P
+    #------------------------------------
+    # Likelihood terms, ignoring the
+    # diffuse first observation of a team.
+    #------------------------------------
+    counted = observed & seen
+    SSE    += np.where(counted, e**2/F, 0)
+    logF   += np.where(counted, np.log(F), 0)
+    nObs   += counted
+    seen   |= observed
+
+  return x, P, SSE, logF, nObs, seen
+#----------------------------------------------------------------------
+# Signal-to-noise ratios Q/R over which the team-strength model is fit.
+#----------------------------------------------------------------------
+KALMAN_RATIOS = np.logspace(-4, 1, 51)
+#----------------------------------------------------------------------
+# Function to estimate the covariate effect of the team-strength
+# model, a local-level Kalman filter over weekly actual scores,
+# optionally adjusted for the Sleeper projection,
+#
+#   y_t = x_t + beta*(projected_t - league mean projected_t) + v_t
+#
+# from pooled least squares on team-demeaned scores, using the moment
+# sums of a grid.
+# ----------
+# Arguments:
+# ----------
+# a_Grid          (dict)    grid from kalmanGrid
+# ----------
+# Returns:
+# ----------
+# beta            (float)   covariate effect
+#----------------------------------------------------------------------
+def kalmanBeta(a_Grid):
+  n, Sa, Sc, Sac, Scc = a_Grid['moments']
+  teams = n > 0
+  numerator   = np.sum(Sac[teams] - Sa[teams]*Sc[teams]/n[teams])
+  denominator = np.sum(Scc[teams] - Sc[teams]**2/n[teams])
+  beta = 0.0
+  if denominator > 0:
+    beta = float(numerator/denominator)
+
+  return beta
+#----------------------------------------------------------------------
+# Function to filter the observations for every ratio of KALMAN_RATIOS
+# at once, with R = 1, i.e., ratios x components x teams. The filter
+# is linear in the observations, so the actual scores, the centered
+# projections and their sum are filtered as separate components, from
+# which kalmanSelect assembles the filter of any covariate effect. The
+# filter either starts from a diffuse prior at the first week's league
+# mean, or continues a previous grid with the weeks that followed it.
+# ----------
+# Arguments:
+# ----------
+# a_Y             (array)   weeks x components x teams observations
+#                           from kalmanObservation
+# a_Grid          (dict)    grid to continue, or None
+# ----------
+# Returns:
+# ----------
+# grid            (dict)    filtered state 'x' and variance 'P', and
+#                           the likelihood sums 'SSE', 'logF' and
+#                           'nObs', of every ratio, the teams 'seen',
+#                           and the 'moments' of kalmanBeta (weeks and
+#                           sums of actual, centered projection, their
+#                           product and the centered projection squared)
+#----------------------------------------------------------------------
+def kalmanGrid(a_Y, a_Grid=None):
+  if a_Grid is None:
+    first  = np.nonzero(~np.all(np.isnan(a_Y[:,0]), axis=1))[0][0]
+    a_Grid = {'x'       : np.nanmean(a_Y[first], axis=1)[:,None]*np.ones((len(KALMAN_RATIOS),) + a_Y.shape[1:]),
+              'P'       : 1e4*np.ones((len(KALMAN_RATIOS),) + a_Y.shape[1:]),
+              'SSE'     : 0,
+              'logF'    : 0,
+              'nObs'    : 0,
+              'seen'    : np.zeros(a_Y.shape[1:], dtype=bool),
+              'moments' : np.zeros((5, a_Y.shape[2]))}
+  x, P, SSE, logF, nObs, seen = kalmanFilter(a_Y[:,None], a_Grid['x'], a_Grid['P'], KALMAN_RATIOS[:,None,None], 1.0, a_Grid['seen'])
+
+  actual, centered = a_Y[:,0], a_Y[:,1]
+  moments = np.array([np.sum(~np.isnan(actual), axis=0),
+                      np.nansum(actual, axis=0),
+                      np.nansum(centered, axis=0),
+                      np.nansum(actual*centered, axis=0),
+                      np.nansum(centered**2, axis=0)])
+
+  grid = {'x'       : x,
+          'P'       : P,
+          'SSE'     : a_Grid['SSE'] + SSE,
+          'logF'    : a_Grid['logF'] + logF,
+          'nObs'    : a_Grid['nObs'] + nObs,
+          'seen'    : seen[0],
+          'moments' : a_Grid['moments'] + moments}
+
+  return grid
+#----------------------------------------------------------------------
+# Function to estimate the covariate effect of a grid, assemble the
+# filter of observations less that effect from the components, pick
+# the ratio with the largest concentrated log-likelihood, pooling all
+# teams, and scale its filtered state to R.
+# ----------
+# Arguments:
+# ----------
+# a_Grid          (dict)    grid from kalmanGrid
+# ----------
+# Returns:
+# ----------
+# state           (dict)    filtered strength 'x' and variance 'P',
+#                           and the parameters 'Q', 'R' and 'beta'
+#----------------------------------------------------------------------
+def kalmanSelect(a_Grid):
+  beta = kalmanBeta(a_Grid)
+  x    = a_Grid['x'][:,0] - beta*a_Grid['x'][:,1]
+  SSE  = a_Grid['SSE'][:,0] - beta*(a_Grid['SSE'][:,2] - a_Grid['SSE'][:,0] - a_Grid['SSE'][:,1]) + beta**2*a_Grid['SSE'][:,1]
+  n    = np.sum(a_Grid['nObs'][:,0], axis=1)
+  R    = np.sum(SSE, axis=1)/n
+  logL = -0.5*(n*np.log(2*np.pi*R) + np.sum(a_Grid['logF'][:,0], axis=1) + n)
+  best = int(np.nanargmax(logL))
+
+  state = {'x'    : x[best],
+           'P'    : a_Grid['P'][best,0]*R[best],
+           'Q'    : float(KALMAN_RATIOS[best]*R[best]),
+           'R'    : float(R[best]),
+           'beta' : beta}
+
+  return state
+#----------------------------------------------------------------------
+# Function to fit and run the team-strength model from scratch. The
+# noise variances are estimated by maximizing the pooled likelihood
+# over KALMAN_RATIOS, with all ratios and teams filtered at once (R is
+# concentrated out of the likelihood).
+# ----------
+# Arguments:
+# ----------
+# a_Actual        (array)   weeks x teams actual scores
+# a_Projected     (array)   weeks x teams projected scores, or None
+# ----------
+# Returns:
+# ----------
+# state           (dict)    filtered strength 'x' and variance 'P',
+#                           and the parameters 'Q', 'R' and 'beta'
+#----------------------------------------------------------------------
+def kalmanFit(a_Actual, a_Projected):
+  return kalmanSelect(kalmanGrid(kalmanObservation(a_Actual, a_Projected)))
+#----------------------------------------------------------------------
+# Function to compute the observation components of the team-strength
+# model: the actual scores, the projections relative to the week's
+# league mean (zero without projections) and their sum. A week of a
+# team missing either score is missing in all components.
+# ----------
+# Arguments:
+# ----------
+# a_Actual        (array)   weeks x teams actual scores
+# a_Projected     (array)   weeks x teams projected scores, or None
+# ----------
+# Returns:
+# ----------
+# y               (array)   weeks x components x teams observations
+#----------------------------------------------------------------------
+def kalmanObservation(a_Actual, a_Projected):
+  centered = np.zeros(a_Actual.shape)
+  if a_Projected is not None:
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore', category=RuntimeWarning)
+      centered = a_Projected - np.nanmean(a_Projected, axis=1)[:,None]
+  missing  = np.isnan(a_Actual) | np.isnan(centered)
+  actual   = np.where(missing, np.nan, a_Actual)
+  centered = np.where(missing, np.nan, centered)
+
+  return np.stack([actual, centered, actual + centered], axis=1)
+#----------------------------------------------------------------------
+# Function to analyze team strength with the Kalman filter and plot the
+# head-to-head win probabilities for next week. The filter of every
+# ratio and its likelihood and moment sums are persisted in
+# kalman_state.json, so that each new week of data is a single update
+# step, after which the covariate effect and the noise variances are
+# estimated again. The grid is refiltered if the teams or the already
+# filtered weeks change, so the result is always that of fitting all
+# weeks from scratch.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# a_Summary       (dict)    summary statistics from summaryStatistics
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def kalmanAnalysis(a_LeagueData, a_TeamOwnerList, a_Summary, args):
+  print("Filtering team strengths...")
+  nTeams    = len(a_TeamOwnerList)
+  actual    = a_Summary['Actual']['data']
+  projected = a_Summary['Projected']['data'] if args.kalman_projected else None
+  #-------------------------------------------
+  # Weeks played are those with any score, and
+  # next week is the one after the last.
+  #-------------------------------------------
+  played = np.nonzero(~np.all(np.isnan(actual), axis=1))[0]
+  if len(played) < 2:
+    print("Fewer than two weeks played, skipping team strengths.\n")
+    return
+  nWeeks = int(played[-1]) + 1
+  #---------------------------------------
+  # Checksum of the data of the first weeks,
+  # to detect edits to already filtered weeks.
+  #---------------------------------------
+  def checksum(a_Week):
+    data = np.round(actual[0:a_Week], 4).tobytes()
+    if projected is not None:
+      data += np.round(projected[0:a_Week], 4).tobytes()
+    return hashlib.sha1(data).hexdigest()
+  #---------------------------------------------
+  # Load the persisted grid if it is still valid
+  # for this data, updating it only with the new
+  # weeks; otherwise filter all weeks.
+  #---------------------------------------------
+  y         = kalmanObservation(actual[0:nWeeks], None if projected is None else projected[0:nWeeks])
+  statePath = LEAGUE + '/' + args.year + '/kalman_state.json'
+  grid      = None
+  if os.path.exists(statePath):
+    statefile = open(statePath, 'r')
+    saved     = json.load(statefile)
+    statefile.close()
+    if 'moments' in saved.get('grid', {}) and saved['teams'] == a_TeamOwnerList and saved['projected'] == args.kalman_projected \
+       and saved['week'] <= nWeeks and saved['checksum'] == checksum(saved['week']):
+      grid = kalmanGrid(y[saved['week']:nWeeks], {stat: np.array(value) for stat, value in saved['grid'].items()})
+      print("Updated persisted team strengths from week " + str(saved['week']) + " to week " + str(nWeeks) + ".")
+  if grid is None:
+    grid = kalmanGrid(y)
+  state = kalmanSelect(grid)
+
+  statefile = open(statePath, 'w')
+  json.dump({'teams'     : a_TeamOwnerList,
+             'projected' : args.kalman_projected,
+             'week'      : nWeeks,
+             'checksum'  : checksum(nWeeks),
+             'beta'      : state['beta'],
+             'grid'      : {stat: np.asarray(value).tolist() for stat, value in grid.items()}}, statefile, indent=1)
+  statefile.close()
+  #---------------------------------------------
+  # Predict next week, using next week's
+  # projections if they are already available.
+  #---------------------------------------------
+  mean = state['x'].copy()
+  if projected is not None and nWeeks < projected.shape[0] and not np.any(np.isnan(projected[nWeeks])):
+    mean += state['beta']*(projected[nWeeks] - np.mean(projected[nWeeks]))
+  var  = state['P'] + state['Q'] + state['R']
+  #-------------------------------------------
+  # Head-to-head win probabilities, P[i,j] is
+  # the probability that team i beats team j.
+  #-------------------------------------------
+  winProb = stats.norm.cdf((mean[:,None] - mean[None,:])/np.sqrt(var[:,None] + var[None,:]))
+  winProb[np.eye(nTeams, dtype=bool)] = np.nan
+  avgProb = np.nanmean(winProb, axis=1)
+  print("Finished filtering team strengths.\n")
+  #-------------
+  # Make heatmap.
+  #-------------
+  print("Plotting next week win probabilities...")
+  plt.figure(figsize=(8,7))
+  plt.imshow(winProb*100, cmap='RdYlGn', vmin=0, vmax=100)
+  for i in range(0, nTeams):
+    for j in range(0, nTeams):
+      if i != j:
+        plt.text(j, i, '{:.0f}'.format(winProb[i,j]*100), ha='center', va='center')
+  plt.colorbar(label='Win probability (percent)', fraction=0.046, pad=0.04)
+  plt.xticks(ticks=np.arange(nTeams), labels=a_TeamOwnerList, rotation=45)
+  plt.yticks(ticks=np.arange(nTeams), labels=a_TeamOwnerList)
+  plt.ylabel("Team",fontsize=16)
+  plt.xlabel("Opponent",fontsize=16)
+  plt.suptitle("Week " + str(nWeeks + 1) + " head-to-head win probabilities", y=0.98, fontsize=18)
+  saveFigure(figureDirectory(args) + '/figures/kalman/win_probability', 'kalman', args)
+  plt.close()
+  #----------------
+  # Create texfile.
+  #----------------
+  texfile = open(LEAGUE + '/' + args.year + '/kalman.tex', 'w')
+  texfile.write('\\begin{figure}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/kalman/win_probability.pdf}\n')
+  writeCaption(texfile, 'kalman', 'Probability (in percent) that each team (rows) beats each opponent (columns) in week ' + str(nWeeks + 1) + ', from the filtered team strengths.', args)
+  texfile.write('\\label{fig:Kalman_Win_Probability}\n')
+  texfile.write('\\end{figure}\n\n')
+  #-------------------------------------
+  # Team strength table, strongest first.
+  #-------------------------------------
+  texfile.write('\\begin{table}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\begin{tabular}{lcccc}\n')
+  texfile.write('\\toprule\n')
+  texfile.write('Team & Strength & Std. dev. & Predicted score & Avg. win prob. \\\\\n')
+  texfile.write('\\midrule\n')
+  table = '<table>\n<tr><th>Team</th><th>Strength</th><th>Std. dev.</th><th>Predicted score</th><th>Avg. win prob.</th></tr>\n'
+  for teamID in np.argsort(-state['x'], kind='stable'):
+    row = ['{:.2f}'.format(state['x'][teamID]), '{:.2f}'.format(np.sqrt(state['P'][teamID])), '{:.2f}'.format(mean[teamID]), '{:.1f}'.format(avgProb[teamID]*100)]
+    texfile.write(a_TeamOwnerList[teamID] + ' & ' + ' & '.join(row[0:3]) + ' & ' + row[3] + '\\% \\\\\n')
+    table += '<tr><td>' + html.escape(a_TeamOwnerList[teamID]) + '</td><td>' + '</td><td>'.join(row[0:3]) + '</td><td>' + row[3] + '%</td></tr>\n'
+  table += '</table>\n'
+  texfile.write('\\bottomrule\n')
+  texfile.write('\\end{tabular}\n')
+  caption = 'Filtered team strength after week ' + str(nWeeks) + ' (local-level Kalman filter' + (', adjusted for the Sleeper projection' if projected is not None else '') + '), its standard deviation, the predicted score for week ' + str(nWeeks + 1) + ', and the average probability of beating any other team. Process noise deviation: ' + '{:.2f}'.format(np.sqrt(state['Q'])) + ', observation noise deviation: ' + '{:.2f}'.format(np.sqrt(state['R'])) + '.'
+  texfile.write('\\caption{' + caption + '}\n')
+  texfile.write('\\label{tab:Kalman_Strength}\n')
+  texfile.write('\\end{table}')
+  texfile.close()
+  addTable('kalman', table, caption, args)
+
+  print("Finished plotting next week win probabilities.\n")
+
+  return
+#----------------------------------------------------------------------
+# Tolerances of the --verify mode, relative and absolute.
+#----------------------------------------------------------------------
+VERIFY_RTOL = 1e-6
+VERIFY_ATOL = 1e-8
+#----------------------------------------------------------------------
+# Function to compute the summary statistics the straightforward way,
+# i.e., sheet by sheet and team by team over the played weeks, as a
+# reference for summaryStatistics.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# a_Whiskers      (list)    box plot whisker percentiles
+# ----------
+# Returns:
+# ----------
+# summary         (dict)    same as summaryStatistics
+#----------------------------------------------------------------------
+def referenceStatistics(a_LeagueData, a_TeamOwnerList, a_Whiskers):
+  percents = sorted(set(float(q) for q in SUMMARY_QUANTILES + list(a_Whiskers)))
+  nWeeks   = len(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual"])
+  #-------------------------------------------
+  # Statistics of the played (non-NaN) values.
+  #-------------------------------------------
+  def statistics(a_Values):
+    values = a_Values[~np.isnan(a_Values)]
+    if len(values) == 0:
+      return {'count': 0, 'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan, 'total': 0.0, 'quantiles': np.full(len(percents), np.nan), 'CV': np.nan}
+    return {'count'     : len(values),
+            'mean'      : np.mean(values),
+            'std'       : np.std(values),
+            'min'       : np.min(values),
+            'max'       : np.max(values),
+            'total'     : np.sum(values),
+            'quantiles' : np.percentile(values, percents),
+            'CV'        : np.std(values)/np.mean(values) if abs(np.mean(values)) > 1e-9*np.std(values) else np.nan}
+
+  summary  = {}
+  for series in summarySeries(a_LeagueData):
+    if series == 'Differential':
+      data = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float) - a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+    elif series == 'Efficiency':
+      data = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)/a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)*100
+    elif series == 'Wins':
+      data = a_LeagueData.loc[a_LeagueData['Sheet'] == 'Matchup Differential', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float, copy=True)[0:nWeeks]
+      data[data > 0]  = 1
+      data[data <= 0] = 0
+    else:
+      data = a_LeagueData.loc[a_LeagueData["Sheet"] == series, a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+    data = data[0:nWeeks]
+    #-----------------
+    # Team statistics.
+    #-----------------
+    team = {'count': [], 'mean': [], 'std': [], 'min': [], 'max': [], 'total': [], 'quantiles': [], 'CV': []}
+    for teamID in range(0, len(a_TeamOwnerList)):
+      for stat, value in statistics(data[:,teamID]).items():
+        team[stat].append(value)
+    team = {stat: np.array(value) for stat, value in team.items()}
+    team['quantiles'] = team['quantiles'].T
+    #-------------------
+    # League statistics.
+    #-------------------
+    league = statistics(data.flatten())
+    summary[series] = {'data': data, 'percents': percents, 'team': team, 'league': league}
+
+  return summary
+#----------------------------------------------------------------------
+# Function to compute the schedule swap matrix with explicit loops, as
+# a reference for scheduleSwapMatrix.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# ----------
+# Returns:
+# ----------
+# wins            (array)   same as scheduleSwapMatrix
+#----------------------------------------------------------------------
+def referenceScheduleSwapMatrix(a_LeagueData, a_TeamOwnerList):
+  actual = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  diff   = a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  nTeams = len(a_TeamOwnerList)
+  wins   = np.zeros((nTeams, nTeams), dtype=int)
+  for i in range(0, nTeams):
+    for j in range(0, nTeams):
+      for week in range(0, actual.shape[0]):
+        opponent = actual[week,j] - diff[week,j]
+        #------------------------------------------
+        # Team i faces team j if it was team j's
+        # opponent, and team j's opponent otherwise.
+        #------------------------------------------
+        if i != j and np.isclose(actual[week,i], opponent) and np.isclose(diff[week,i], -diff[week,j]):
+          opponent = actual[week,j]
+        if actual[week,i] > opponent:
+          wins[i,j] += 1
+
+  return wins
+#----------------------------------------------------------------------
+# Function to compute the team and league statistics of the score
+# plots the way the original analyses did, i.e., each over the whole
+# weeks x teams matrix of the series, as a reference for the summary
+# statistics they now use. Teams without any score, then weeks not
+# played by every other team, are dropped first.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# ----------
+# Returns:
+# ----------
+# scores          (dict)    per series, 'mean_team' and 'std_team'
+#                           (arrays over teams) and 'mean_total'
+#----------------------------------------------------------------------
+def referenceScoreStatistics(a_LeagueData, a_TeamOwnerList):
+  actual    = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  projected = a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  possible  = a_LeagueData.loc[a_LeagueData["Sheet"] == "Possible", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  diff      = a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)[0:actual.shape[0]]
+  series    = {'Actual'               : actual,
+               'Projected'            : projected,
+               'Differential'         : actual - projected,
+               'Possible'             : possible,
+               'Efficiency'           : actual/possible*100,
+               'Matchup Differential' : diff}
+  scores = {}
+  for name, data in series.items():
+    teams = ~np.all(np.isnan(data), axis=0)
+    data  = data[:, teams]
+    data  = data[~np.any(np.isnan(data), axis=1)]
+    scores[name] = {'mean_team'  : np.full(len(a_TeamOwnerList), np.nan),
+                    'std_team'   : np.full(len(a_TeamOwnerList), np.nan),
+                    'mean_total' : np.nan}
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore', category=RuntimeWarning)
+      scores[name]['mean_team'][teams] = np.mean(data, axis=0)
+      scores[name]['std_team'][teams]  = np.std(data, axis=0)
+      scores[name]['mean_total']       = np.mean(data)
+
+  return scores
+#----------------------------------------------------------------------
+# Function to write the score_*.tex files the way the original
+# analyses did, one figure of weekly plots per team followed by the
+# variance figures, as a reference for the score analyses.
+# ----------
+# Arguments:
+# ----------
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def referenceScoreTex(a_TeamOwnerList, args):
+  scores = [('actual', 'Team scoring week-by-week.',
+             [('variance_all', 'Variance of team performances over the duration of the season. Dashed black line indicates the league average score.')]),
+            ('projected', 'Projected team scoring week-by-week. Black lines indicate the Sleeper projection generated pre-kickoffs, and red lines indicate the actual score.',
+             [('variance_all', 'Variance of \\textit{projected} team performances over the duration of the season. Dashed black line indicates the league average projected score.'),
+              ('variance_differential_all', 'Variance of \\textit{projected} team performances subtracted from \\textit{actual} team scores over the duration of the season. Dashed black line indicates the league average differential, which was positive over the season, meaning that on average everyone out-performed the Sleeper projection. A higher number indicates that a team out-performed projection, while a lower number indicates a team under-performed projection.')]),
+            ('possible', 'Possible team scoring week-by-week. Black lines indicate the score given an optimal starting lineup, and red lines indicate the actual score.',
+             [('variance_all', 'Variance of \\textit{possible} team performances over the duration of the season. Dashed black line indicates the league average possible score.'),
+              ('variance_efficiency_all', 'Variance of team owner efficiency over the duration of the season, where $\\text{efficiency } = \\frac{\\text{Actual score}}{\\text{Possible score}}$. Dashed black line indicates the league average efficiency.')]),
+            ('differential', 'Point differentials in weekly matchups for each team.',
+             [('variance_all', 'Variance of point differentials in weekly matchups over the duration of the season.')])]
+  for section, weeklyCaption, figures in scores:
+    texfile = open(LEAGUE + '/' + args.year + '/score_' + section + '.tex', 'w')
+    texfile.write('\\begin{figure}[htb!]\n')
+    texfile.write('\\centering\n')
+    for teamID in range(0, len(a_TeamOwnerList)):
+      texfile.write('\\subfigure{\\includegraphics[width=0.3\\textwidth]{./figures/' + section + '/weekly_' + a_TeamOwnerList[teamID] + '.pdf}}')
+      if (teamID + 1) % 3 == 0:
+        texfile.write('\\\\')
+      texfile.write('\n')
+    texfile.write('\\caption{' + weeklyCaption + '}\n')
+    texfile.write('\\label{fig:' + section.capitalize() + '_Weekly_Team}\n')
+    texfile.write('\\end{figure}\n\n')
+    for figureID, (figure, caption) in enumerate(figures):
+      texfile.write('\\begin{figure}[htb!]\n')
+      texfile.write('\\centering\n')
+      texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/' + section + '/' + figure + '.pdf}\n')
+      texfile.write('\\caption{' + caption + '}\n')
+      texfile.write('\\end{figure}' + ('\n\n' if figureID < len(figures) - 1 else ''))
+    texfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to write schedule_swap.tex from the loop reference of the
+# schedule swap matrix, with the strength of schedule summed team by
+# team, as a reference for scheduleSwapAnalysis.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def referenceScheduleSwapTex(a_LeagueData, a_TeamOwnerList, args):
+  wins     = referenceScheduleSwapMatrix(a_LeagueData, a_TeamOwnerList)
+  nTeams   = len(a_TeamOwnerList)
+  expected = []
+  SoS      = []
+  for i in range(0, nTeams):
+    expected.append(sum([wins[i,j] for j in range(0, nTeams) if j != i])/(nTeams - 1))
+    SoS.append(sum([wins[j,i] for j in range(0, nTeams) if j != i])/(nTeams - 1))
+  #------------------------------------
+  # Hardest schedule (fewest wins) first,
+  # with tied teams sharing the best rank.
+  #------------------------------------
+  order = sorted(range(0, nTeams), key=lambda teamID: SoS[teamID])
+  rank  = [1 + sum([1 for j in range(0, nTeams) if SoS[j] < SoS[i]]) for i in range(0, nTeams)]
+
+  texfile = open(LEAGUE + '/' + args.year + '/schedule_swap.tex', 'w')
+  texfile.write('\\begin{figure}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/schedule/swap_matrix.pdf}\n')
+  texfile.write('\\caption{Number of wins each team (rows) would have had playing each team\'s schedule (columns). The diagonal, in bold, is each team\'s actual record.}\n')
+  texfile.write('\\label{fig:Schedule_Swap}\n')
+  texfile.write('\\end{figure}\n\n')
+  texfile.write('\\begin{table}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\begin{tabular}{lcccc}\n')
+  texfile.write('\\toprule\n')
+  texfile.write('Team & Wins & Avg. wins (other schedules) & Opp. avg. wins (own schedule) & SoS rank \\\\\n')
+  texfile.write('\\midrule\n')
+  for teamID in order:
+    texfile.write(a_TeamOwnerList[teamID] + ' & ' + str(wins[teamID,teamID]) + ' & ' + '{:.2f}'.format(expected[teamID]) + ' & ' + '{:.2f}'.format(SoS[teamID]) + ' & ' + str(rank[teamID]) + ' \\\\\n')
+  texfile.write('\\bottomrule\n')
+  texfile.write('\\end{tabular}\n')
+  texfile.write('\\caption{Strength of schedule (SoS), ordered from hardest to easiest schedule. SoS is measured by the average number of wins every other team would have had with a given team\'s schedule.}\n')
+  texfile.write('\\label{tab:Schedule_Swap}\n')
+  texfile.write('\\end{table}')
+  texfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to compute the correlations of regressionAnalysis the way
+# the original analysis did, i.e., from the season totals of the
+# sheets, as a reference for regressionAnalysis.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def referenceRegressionAnalysis(a_LeagueData, a_TeamOwnerList, args):
+  #--------------------------------------------
+  # Determine each team's total number of wins.
+  #--------------------------------------------
+  if 'Geed' in a_LeagueData.columns.to_list():
+    diff            = a_LeagueData.loc[a_LeagueData['Sheet'] == 'Matchup Differential', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy()
+    diff[diff > 0]  = 1
+    diff[diff <= 0] = 0
+    record          = np.sum(diff, axis=0)
+    record_Median   = np.sum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  else:
+    record   = np.sum(a_LeagueData.loc[a_LeagueData['Sheet'] == 'Record', a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  #----------------------------------------
+  # Determine total PF actual and possible.
+  #----------------------------------------
+  totalPF   = np.sum(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  #-------------------------------------------------------
+  # Determine coefficient of variance of every team, i.e.,
+  # CoV = deviation of team score / average of team score
+  #-------------------------------------------------------
+  CV   = np.zeros(len(a_TeamOwnerList))
+  mean = np.mean(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  std  = np.std(a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(), axis=0)
+  for teamID in range(0, len(a_TeamOwnerList)):
+    CV[teamID] = std[teamID]/mean[teamID]
+  #---------------------------------------------------------------------------
+  # Generate new data frame for statistical analysis for measures of interest.
+  #---------------------------------------------------------------------------
+  recordDF = pd.DataFrame({'Team' : a_TeamOwnerList, 'Record': record, 'PF': totalPF,  'CV' : CV})
+  #-------------------------------------------
+  # Perform regression of total PF vs. record.
+  #-------------------------------------------
+  result_PF = ols(formula='Record ~ PF', data=recordDF).fit()
+  #-------------------------------
+  # Write janky table to tex file.
+  #-------------------------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPF.tex','w')
+  texfile.write(result_PF.summary().as_latex())
+  texfile.close()
+  #------------
+  # Formatting.
+  #------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPF.tex', 'r')
+  lines = texfile.readlines()
+  lines.insert(0, '\\begin{table}[htb!]\n')
+  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and team total points (PF).}\n'
+  lines = lines[0:-4]
+  lines.insert(-1, '\\end{table}\n')
+  texfile.close()
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPF.tex', 'w')
+  texfile.writelines(lines)
+  texfile.close()
+  #-------------------------------------
+  # Perform regression of CV vs. record.
+  #-------------------------------------
+  result_CV = ols(formula='Record ~ CV', data=recordDF).fit()
+  #-------------------------------
+  # Write janky table to tex file.
+  #-------------------------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RCV.tex','w')
+  texfile.write(result_CV.summary().as_latex())
+  texfile.close()
+  #------------
+  # Formatting.
+  #------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RCV.tex', 'r')
+  lines = texfile.readlines()
+  lines.insert(0, '\\begin{table}[htb!]\n')
+  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and team points correlation of variation (CV).}\n'
+  lines = lines[0:-2]
+  lines.insert(-1, '\\end{table}\n')
+  texfile.close()
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RCV.tex', 'w')
+  texfile.writelines(lines)
+  texfile.close()
+  #------------------------------------------
+  # Perform regression of CV + PF vs. record.
+  #------------------------------------------
+  result_Correlation = ols(formula='Record ~ PF + CV + PF * CV', data=recordDF).fit()
+  #-------------------------------
+  # Write janky table to tex file.
+  #-------------------------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPFCV.tex','w')
+  texfile.write(result_Correlation.summary().as_latex())
+  texfile.close()
+  #------------
+  # Formatting.
+  #------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPFCV.tex', 'r')
+  lines = texfile.readlines()
+  lines.insert(0, '\\begin{table}[htb!]\n')
+  lines[31] = '\\caption{Ordinary least-squares regression analysis of correlation between team record and interaction between team total points (PF) and team correlation of variation of points (CV).}\n'
+  lines = lines[0:-4]
+  lines.insert(-1, '\\end{table}')
+  texfile.close()
+  texfile = open(LEAGUE + '/' + args.year + '/regression_RPFCV.tex', 'w')
+  texfile.writelines(lines)
+  texfile.close()
+  #---------------------------------
+  # Perform regression of CV vs. PF.
+  #---------------------------------
+  result_CVPF = ols(formula='PF ~ CV', data=recordDF).fit()
+  #-------------------------------
+  # Write janky table to tex file.
+  #-------------------------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_PFCV.tex','w')
+  texfile.write(result_CVPF.summary().as_latex())
+  texfile.close()
+  #------------
+  # Formatting.
+  #------------
+  texfile = open(LEAGUE + '/' + args.year + '/regression_PFCV.tex', 'r')
+  lines = texfile.readlines()
+  lines.insert(0, '\\begin{table}[htb!]\n')
+  lines[29] = '\\caption{Ordinary least-squares regression analysis of correlation between team total points (CF) and team points correlation of variation (CV).}\n'
+  lines = lines[0:-2]
+  lines.insert(-1, '\\end{table}\n')
+  texfile.close()
+  texfile = open(LEAGUE + '/' + args.year + '/regression_PFCV.tex', 'w')
+  texfile.writelines(lines)
+  texfile.close()
+  #----------------------------------------------------------
+  # Perform regression of CV + PF vs. record for median wins.
+  #----------------------------------------------------------
+  if 'Geed' in a_LeagueData.columns.to_list() and args.year == '2023':
+    recordMedianDF = pd.DataFrame({'Team' : a_TeamOwnerList, 'Record': record_Median, 'PF': totalPF, 'CV' : CV})
+    resultMedian = ols(formula='Record ~ PF + CV + PF * CV', data=recordMedianDF).fit()
+    #-------------------------------
+    # Write janky table to tex file.
+    #-------------------------------
+    texfile = open(LEAGUE + '/' + args.year + '/regression_MRPFCV.tex','w')
+    texfile.write(resultMedian.summary().as_latex())
+    texfile.close()
+    #------------
+    # Formatting.
+    #------------
+    texfile = open(LEAGUE + '/' + args.year + '/regression_MRPFCV.tex', 'r')
+    lines = texfile.readlines()
+    lines.insert(0, '\\begin{table}[htb!]')
+    lines[31] = '\\caption{Ordinary least-squares regression analysis of correlation between team record \\textbf{using \\textit{median} wins} and interaction between team points and coefficient of variation of team points.}\n'
+    lines = lines[0:-4]
+    lines.insert(-1, '\\end{table}')
+    texfile.close()
+    texfile = open(LEAGUE + '/' + args.year + '/regression_MRPFCV.tex', 'w')
+    texfile.writelines(lines)
+    texfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to write the snapshot_week*.tex files and snapshots.tex the
+# straightforward way, i.e., from the season truncated after every
+# played week, team by team, with statsmodels fits, as a reference for
+# snapshotAnalysis.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def referenceSnapshotTex(a_LeagueData, a_TeamOwnerList, args):
+  actual = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  diff   = a_LeagueData.loc[a_LeagueData["Sheet"] == "Matchup Differential", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  wins   = a_LeagueData.loc[a_LeagueData["Sheet"] == "Record", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  played = [week + 1 for week in range(0, actual.shape[0]) if not np.any(np.isnan(actual[week]))]
+  if not played:
+    return
+  models = [('Record $\\sim$ PF',              'Record ~ PF',                ['PF']),
+            ('Record $\\sim$ CV',              'Record ~ CV',                ['CV']),
+            ('Record $\\sim$ PF + CV + PF:CV', 'Record ~ PF + CV + PF * CV', ['PF', 'CV', 'PF:CV']),
+            ('PF $\\sim$ CV',                  'PF ~ CV',                    ['CV'])]
+  for week in played:
+    #-----------------------------------------
+    # Season statistics after the week, team
+    # by team over the weeks the team played.
+    #-----------------------------------------
+    record, PF, mean, std = [], [], [], []
+    for teamID in range(0, len(a_TeamOwnerList)):
+      column = actual[0:week, teamID]
+      column = column[~np.isnan(column)]
+      PF.append(np.sum(column))
+      mean.append(np.mean(column))
+      std.append(np.std(column))
+      if 'Geed' in a_LeagueData.columns.to_list():
+        record.append(np.sum(diff[0:week, teamID] > 0))
+      else:
+        record.append(np.nansum(wins[0:week, teamID]))
+    CV       = [std[teamID]/mean[teamID] for teamID in range(0, len(a_TeamOwnerList))]
+    recordDF = pd.DataFrame({'Record': record, 'PF': PF, 'CV': CV})
+
+    texfile = open(LEAGUE + '/' + args.year + '/snapshot_week' + str(week) + '.tex', 'w')
+    texfile.write('\\subsection{After week ' + str(week) + '}\n')
+    texfile.write('\\begin{table}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\begin{tabular}{lccccc}\n')
+    texfile.write('\\toprule\n')
+    texfile.write('Team & Record & PF & Mean & Deviation & CV \\\\\n')
+    texfile.write('\\midrule\n')
+    for teamID in range(0, len(a_TeamOwnerList)):
+      texfile.write(a_TeamOwnerList[teamID] + ' & ' + str(int(record[teamID])) + ' & ' + '{:.2f}'.format(PF[teamID]) + ' & ' + '{:.2f}'.format(mean[teamID]) + ' & ' + '{:.2f}'.format(std[teamID]) + ' & ' + '{:.3f}'.format(CV[teamID]) + ' \\\\\n')
+    texfile.write('\\bottomrule\n')
+    texfile.write('\\end{tabular}\n')
+    texfile.write('\\caption{Team statistics after week ' + str(week) + '.}\n')
+    texfile.write('\\end{table}\n\n')
+    texfile.write('\\begin{table}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\begin{tabular}{llcccc}\n')
+    texfile.write('\\toprule\n')
+    texfile.write('Model & Term & Coef. & $t$ & $P>|t|$ & $R^2$ \\\\\n')
+    texfile.write('\\midrule\n')
+    for name, formula, terms in models:
+      result = ols(formula=formula, data=recordDF).fit()
+      for termID in range(0, len(terms)):
+        row = [name if termID == 0 else '', terms[termID], '{:.4g}'.format(result.params[terms[termID]]), '{:.3f}'.format(result.tvalues[terms[termID]]), '{:.3f}'.format(result.pvalues[terms[termID]]), '{:.3f}'.format(result.rsquared) if termID == 0 else '']
+        texfile.write(' & '.join(row) + ' \\\\\n')
+    texfile.write('\\bottomrule\n')
+    texfile.write('\\end{tabular}\n')
+    texfile.write('\\caption{Ordinary least-squares regressions of the season statistics after week ' + str(week) + '.}\n')
+    texfile.write('\\end{table}\n')
+    texfile.close()
+
+  texfile = open(LEAGUE + '/' + args.year + '/snapshots.tex', 'w')
+  if len(played) > 1:
+    texfile.write('\\begin{figure}[htb!]\n')
+    texfile.write('\\centering\n')
+    texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/snapshot/regression_evolution.pdf}\n')
+    texfile.write('\\caption{Coefficient of determination ($R^2$) of the regression models using the season statistics as of each week.}\n')
+    texfile.write('\\end{figure}\n\n')
+    texfile.write('\\clearpage\n')
+  for week in played:
+    texfile.write('\\input{snapshot_week' + str(week) + '.tex}\n')
+    texfile.write('\\clearpage\n')
+  texfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to write kalman.tex from a scalar Kalman filter run team by
+# team and ratio by ratio over KALMAN_RATIOS, with the covariate effect
+# and win probabilities also computed team by team, as a reference for
+# kalmanAnalysis.
+# ----------
+# Arguments:
+# ----------
+# a_LeagueData    (object)  pandas dataframe object for league data
+#                           given by .xls sheets
+# a_TeamOwnerList (list)    list of team owner names
+# args            (object)  command line arguments
+#----------------------------------------------------------------------
+def referenceKalmanTex(a_LeagueData, a_TeamOwnerList, args):
+  nTeams    = len(a_TeamOwnerList)
+  actual    = a_LeagueData.loc[a_LeagueData["Sheet"] == "Actual", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)
+  projected = a_LeagueData.loc[a_LeagueData["Sheet"] == "Projected", a_TeamOwnerList[0]:a_TeamOwnerList[-1]].to_numpy(dtype=float)[0:actual.shape[0]]
+  played    = [week for week in range(0, actual.shape[0]) if not np.all(np.isnan(actual[week]))]
+  if len(played) < 2:
+    return
+  nWeeks = played[-1] + 1
+  #--------------------------------------------
+  # Projections relative to the week's league
+  # mean, and the covariate effect from least
+  # squares on team-demeaned scores.
+  #--------------------------------------------
+  beta     = 0.0
+  centered = np.zeros((nWeeks, nTeams))
+  if args.kalman_projected:
+    for week in range(0, nWeeks):
+      for teamID in range(0, nTeams):
+        centered[week,teamID] = projected[week,teamID] - np.nanmean(projected[week])
+    numerator, denominator = 0.0, 0.0
+    for teamID in range(0, nTeams):
+      weeks = [week for week in range(0, nWeeks) if not np.isnan(actual[week,teamID]) and not np.isnan(centered[week,teamID])]
+      if not weeks:
+        continue
+      pMean = np.mean([centered[week,teamID] for week in weeks])
+      yMean = np.mean([actual[week,teamID] for week in weeks])
+      for week in weeks:
+        numerator   += (actual[week,teamID] - yMean)*(centered[week,teamID] - pMean)
+        denominator += (centered[week,teamID] - pMean)**2
+    if denominator > 0:
+      beta = numerator/denominator
+  y = actual[0:nWeeks] - beta*centered
+  #-------------------------------------------
+  # Filter every team for every ratio with R = 1
+  # from the first played week's league mean,
+  # keeping the ratio of largest likelihood.
+  #-------------------------------------------
+  start = np.mean([value for value in y[played[0]] if not np.isnan(value)])
+  best  = None
+  for ratio in KALMAN_RATIOS:
+    SSE, logF, nObs = 0.0, 0.0, 0
+    x, P = [], []
+    for teamID in range(0, nTeams):
+      xTeam, PTeam, seen = start, 1e4, False
+      for week in range(0, nWeeks):
+        PTeam = PTeam + ratio
+        F     = PTeam + 1.0
+        if np.isnan(y[week,teamID]):
+          continue
+        e = y[week,teamID] - xTeam
+        if seen:
+          SSE  += e**2/F
+          logF += np.log(F)
+          nObs += 1
+        K     = PTeam/F
+        xTeam = xTeam + K*e
+        PTeam = (1 - K)*PTeam
+        seen  = True
+      x.append(xTeam)
+      P.append(PTeam)
+    R    = SSE/nObs
+    logL = -0.5*(nObs*np.log(2*np.pi*R) + logF + nObs)
+    if not np.isnan(logL) and (best is None or logL > best[0]):
+      best = (logL, ratio*R, R, x, [PTeam*R for PTeam in P])
+  logL, Q, R, x, P = best
+  #---------------------------------------
+  # Predicted scores and win probabilities.
+  #---------------------------------------
+  mean = list(x)
+  if args.kalman_projected and nWeeks < projected.shape[0] and not np.any(np.isnan(projected[nWeeks])):
+    for teamID in range(0, nTeams):
+      mean[teamID] += beta*(projected[nWeeks,teamID] - np.mean(projected[nWeeks]))
+  avgProb = []
+  for i in range(0, nTeams):
+    probs = [stats.norm.cdf((mean[i] - mean[j])/np.sqrt(P[i] + Q + R + P[j] + Q + R)) for j in range(0, nTeams) if j != i]
+    avgProb.append(np.mean(probs))
+
+  texfile = open(LEAGUE + '/' + args.year + '/kalman.tex', 'w')
+  texfile.write('\\begin{figure}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\includegraphics[width=0.9\\textwidth]{./figures/kalman/win_probability.pdf}\n')
+  texfile.write('\\caption{Probability (in percent) that each team (rows) beats each opponent (columns) in week ' + str(nWeeks + 1) + ', from the filtered team strengths.}\n')
+  texfile.write('\\label{fig:Kalman_Win_Probability}\n')
+  texfile.write('\\end{figure}\n\n')
+  texfile.write('\\begin{table}[htb!]\n')
+  texfile.write('\\centering\n')
+  texfile.write('\\begin{tabular}{lcccc}\n')
+  texfile.write('\\toprule\n')
+  texfile.write('Team & Strength & Std. dev. & Predicted score & Avg. win prob. \\\\\n')
+  texfile.write('\\midrule\n')
+  for teamID in sorted(range(0, nTeams), key=lambda teamID: -x[teamID]):
+    texfile.write(a_TeamOwnerList[teamID] + ' & ' + '{:.2f}'.format(x[teamID]) + ' & ' + '{:.2f}'.format(np.sqrt(P[teamID])) + ' & ' + '{:.2f}'.format(mean[teamID]) + ' & ' + '{:.1f}'.format(avgProb[teamID]*100) + '\\% \\\\\n')
+  texfile.write('\\bottomrule\n')
+  texfile.write('\\end{tabular}\n')
+  texfile.write('\\caption{Filtered team strength after week ' + str(nWeeks) + ' (local-level Kalman filter' + (', adjusted for the Sleeper projection' if args.kalman_projected else '') + '), its standard deviation, the predicted score for week ' + str(nWeeks + 1) + ', and the average probability of beating any other team. Process noise deviation: ' + '{:.2f}'.format(np.sqrt(Q)) + ', observation noise deviation: ' + '{:.2f}'.format(np.sqrt(R)) + '.}\n')
+  texfile.write('\\label{tab:Kalman_Strength}\n')
+  texfile.write('\\end{table}')
+  texfile.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to write a synthetic league workbook, with the same sheets
+# as the bundled ones, for --verify.
+# ----------
+# Arguments:
+# ----------
+# a_Path   (str)   .xlsx file path
+# a_Teams  (int)   number of teams (even)
+# a_Weeks  (int)   number of weeks
+# a_Seed   (int)   random seed
+#----------------------------------------------------------------------
+def syntheticLeague(a_Path, a_Teams, a_Weeks, a_Seed):
+  rng      = np.random.default_rng(a_Seed)
+  owners   = ['Team' + str(teamID + 1) for teamID in range(0, a_Teams)]
+  strength = rng.normal(110, 10, a_Teams)
+  actual   = np.round(strength + rng.normal(0, 20, (a_Weeks, a_Teams)), 2)
+  sheets   = {'Actual'    : actual,
+              'Projected' : np.round(strength + rng.normal(0, 5, (a_Weeks, a_Teams)), 2),
+              'Possible'  : np.round(actual + np.abs(rng.normal(15, 8, (a_Weeks, a_Teams))), 2)}
+  #--------------------------------
+  # Random pairings for every week.
+  #--------------------------------
+  diff = np.zeros((a_Weeks, a_Teams))
+  for week in range(0, a_Weeks):
+    pairs = rng.permutation(a_Teams).reshape(-1, 2)
+    diff[week, pairs[:,0]] = actual[week, pairs[:,0]] - actual[week, pairs[:,1]]
+    diff[week, pairs[:,1]] = -diff[week, pairs[:,0]]
+  sheets['Record']               = (diff > 0).astype(int) + (actual > np.median(actual, axis=1)[:,None]).astype(int)
+  sheets['Matchup Differential'] = np.round(diff, 2)
+
+  writer = pd.ExcelWriter(a_Path)
+  for name, values in sheets.items():
+    sheet = pd.DataFrame(values, columns=owners)
+    sheet.insert(0, 'Week', np.arange(1, a_Weeks + 1))
+    sheet.to_excel(writer, sheet_name=name, index=False)
+  writer.close()
+
+  return
+#----------------------------------------------------------------------
+# Function to compare reference and fast values, recording every
+# mismatch with its location.
+# ----------
+# Arguments:
+# ----------
+# a_Name        (str)     name of the compared statistic
+# a_Reference   (array)   reference values
+# a_Fast        (array)   fast values
+# a_Labels      (list)    list of labels for every axis of the values
+# a_Mismatches  (list)    list of mismatch descriptions, appended to
+#----------------------------------------------------------------------
+def compareValues(a_Name, a_Reference, a_Fast, a_Labels, a_Mismatches):
+  reference = np.asarray(a_Reference, dtype=float)
+  fast      = np.asarray(a_Fast, dtype=float)
+  if reference.shape != fast.shape:
+    a_Mismatches.append(a_Name + ': shape ' + str(reference.shape) + ' (reference) vs. ' + str(fast.shape) + ' (fast)')
+    return
+  close = np.isclose(fast, reference, rtol=VERIFY_RTOL, atol=VERIFY_ATOL, equal_nan=True)
+  for index in np.argwhere(~close):
+    location = ', '.join([str(a_Labels[axis][i]) for axis, i in enumerate(index)])
+    a_Mismatches.append(a_Name + '[' + location + ']: ' + repr(reference[tuple(index)]) + ' (reference) vs. ' + repr(fast[tuple(index)]) + ' (fast)')
+
+  return
+#----------------------------------------------------------------------
+# Function to compare two emitted .tex files. The text must match
+# exactly, and numbers must match to within one unit of the printed
+# precision, as values on a rounding boundary may round either way;
+# date and time stamps are ignored.
+# ----------
+# Arguments:
+# ----------
+# a_Name        (str)     name of the compared file
+# a_Reference   (str)     reference file path
+# a_Fast        (str)     fast file path
+# a_Mismatches  (list)    list of mismatch descriptions, appended to
+#----------------------------------------------------------------------
+def compareTex(a_Name, a_Reference, a_Fast, a_Mismatches):
+  number   = re.compile(r'-?\d+\.?\d*(?:e[-+]?\d+)?')
+  texfile  = open(a_Reference, 'r')
+  refLines = texfile.readlines()
+  texfile.close()
+  texfile  = open(a_Fast, 'r')
+  fstLines = texfile.readlines()
+  texfile.close()
+  if len(refLines) != len(fstLines):
+    a_Mismatches.append(a_Name + ': ' + str(len(refLines)) + ' lines (reference) vs. ' + str(len(fstLines)) + ' lines (fast)')
+    return
+  for lineID in range(0, len(refLines)):
+    if 'Date:' in refLines[lineID] or 'Time:' in refLines[lineID]:
+      continue
+    refNumbers = number.findall(refLines[lineID])
+    fstNumbers = number.findall(fstLines[lineID])
+    if number.sub('#', refLines[lineID]) != number.sub('#', fstLines[lineID]) or len(refNumbers) != len(fstNumbers):
+      a_Mismatches.append(a_Name + ', line ' + str(lineID + 1) + ': text differs')
+      continue
+    for ref, fst in zip(refNumbers, fstNumbers):
+      decimals = len(ref.split('.')[1]) if '.' in ref and 'e' not in ref else 0
+      if abs(float(ref) - float(fst)) > max(VERIFY_RTOL*abs(float(ref)), 1.5*10.0**-decimals):
+        a_Mismatches.append(a_Name + ', line ' + str(lineID + 1) + ': ' + ref + ' (reference) vs. ' + fst + ' (fast)')
+
+  return
+#----------------------------------------------------------------------
+# Function to verify the fast computation paths against the reference
+# ones for a single league workbook, including every .tex file the
+# analyses emit.
+# ----------
+# Arguments:
+# ----------
+# args     (object)  command line arguments, with the workbook as
+#                    inputFile
+# ----------
+# Returns:
+# ----------
+# mismatches (list)  list of mismatch descriptions
+#----------------------------------------------------------------------
+def verifyLeague(args):
+  global LEAGUE
+  mismatches = []
+  leagueData = readData(args)
+  teams      = list(leagueData.columns.values)[1:-1]
+  #----------------------------------------------
+  # readData against reading every sheet directly.
+  #----------------------------------------------
+  workbook = {} if args.sleeper else pd.read_excel(args.inputFile, sheet_name=None)
+  for name, sheet in workbook.items():
+    reference = sheet.iloc[:, 1:].to_numpy()
+    fast      = leagueData.loc[leagueData["Sheet"] == name, teams[0]:teams[-1]].to_numpy()
+    numeric   = pd.api.types.is_numeric_dtype(sheet.iloc[:, 1:].stack()) if reference.size else True
+    if numeric:
+      compareValues('readData[' + name + ']', reference, fast, [range(1, reference.shape[0] + 1), teams], mismatches)
+  #-----------------------------------
+  # Summary and box plot statistics.
+  #-----------------------------------
+  fast      = summaryStatistics(leagueData, teams, args.whis)
+  reference = referenceStatistics(leagueData, teams, args.whis)
+  percents  = ['q' + '{:g}'.format(q) for q in reference['Actual']['percents']]
+  for series in reference:
+    for stat in reference[series]['team']:
+      labels = [percents, teams] if stat == 'quantiles' else [teams]
+      compareValues(series + ' team ' + stat, reference[series]['team'][stat], fast[series]['team'][stat], labels, mismatches)
+      compareValues(series + ' league ' + stat, reference[series]['league'][stat], fast[series]['league'][stat], [percents] if stat == 'quantiles' else [], mismatches)
+  for series in ['Actual', 'Projected', 'Possible', 'Matchup Differential', 'Differential', 'Efficiency']:
+    boxStats  = boxStatistics(fast[series], teams, args.whis)
+    reference = cbook.boxplot_stats([column[~np.isnan(column)] for column in fast[series]['data'].T], whis=args.whis)
+    for stat in ['mean', 'med', 'q1', 'q3', 'whislo', 'whishi']:
+      compareValues(series + ' box ' + stat, [box[stat] for box in reference], [box[stat] for box in boxStats], [teams], mismatches)
+    for teamID in range(0, len(teams)):
+      compareValues(series + ' box fliers', np.sort(reference[teamID]['fliers']), np.sort(boxStats[teamID]['fliers']), [[teams[teamID]]*len(reference[teamID]['fliers'])], mismatches)
+  #-------------------------------------------
+  # Score plot statistics against the original
+  # full-matrix computations.
+  #-------------------------------------------
+  scores = referenceScoreStatistics(leagueData, teams)
+  for series in scores:
+    compareValues(series + ' mean_team', scores[series]['mean_team'], fast[series]['team']['mean'], [teams], mismatches)
+    compareValues(series + ' std_team', scores[series]['std_team'], fast[series]['team']['std'], [teams], mismatches)
+    compareValues(series + ' mean_total', scores[series]['mean_total'], fast[series]['league']['mean'], [], mismatches)
+  #--------------------------
+  # Schedule swap matrix.
+  #--------------------------
+  compareValues('schedule swap wins', referenceScheduleSwapMatrix(leagueData, teams), scheduleSwapMatrix(leagueData, teams), [teams, teams], mismatches)
+  #-------------------------------------------------
+  # Snapshots of every played week against statistics
+  # and statsmodels fits of the truncated season.
+  #-------------------------------------------------
+  actual    = leagueData.loc[leagueData["Sheet"] == "Actual", teams[0]:teams[-1]].to_numpy(dtype=float)
+  snapshots = snapshotStatistics(leagueData, teams)
+  models    = [('Record ~ PF',                snapshotRegression(snapshots['record'], [snapshots['PF']])),
+               ('Record ~ CV',                snapshotRegression(snapshots['record'], [snapshots['CV']])),
+               ('Record ~ PF + CV + PF * CV', snapshotRegression(snapshots['record'], [snapshots['PF'], snapshots['CV'], snapshots['PF']*snapshots['CV']])),
+               ('PF ~ CV',                    snapshotRegression(snapshots['PF'], [snapshots['CV']]))]
+  for k in np.nonzero(snapshots['played'])[0]:
+    week = 'week ' + str(k + 1)
+    compareValues('snapshot mean, ' + week, np.nanmean(actual[0:k+1], axis=0), snapshots['mean'][k], [teams], mismatches)
+    compareValues('snapshot std, ' + week, np.nanstd(actual[0:k+1], axis=0), snapshots['std'][k], [teams], mismatches)
+    compareValues('snapshot PF, ' + week, np.nansum(actual[0:k+1], axis=0), snapshots['PF'][k], [teams], mismatches)
+    if k == 0:
+      continue
+    recordDF = pd.DataFrame({'Record': snapshots['record'][k], 'PF': np.nansum(actual[0:k+1], axis=0), 'CV': np.nanstd(actual[0:k+1], axis=0)/np.nanmean(actual[0:k+1], axis=0)})
+    for formula, fit in models:
+      result = ols(formula=formula, data=recordDF).fit()
+      terms  = list(result.params.index)
+      compareValues(formula + ' coef, ' + week, result.params.to_numpy(), fit['coef'][k], [terms], mismatches)
+      compareValues(formula + ' t, ' + week, result.tvalues.to_numpy(), fit['t'][k], [terms], mismatches)
+      compareValues(formula + ' p, ' + week, result.pvalues.to_numpy(), fit['p'][k], [terms], mismatches)
+      compareValues(formula + ' R2, ' + week, result.rsquared, fit['R2'][k], [], mismatches)
+  #-------------------------------------------------
+  # Every .tex file, emitted by the analyses into one
+  # temporary LEAGUE directory and by the reference
+  # paths into another. The figures are written next
+  # to a copy of the workbook, without LaTeX fonts.
+  #-------------------------------------------------
+  league  = LEAGUE
+  tempdir = tempfile.mkdtemp()
+  try:
+    for path in ['fast', 'reference']:
+      for section in ['actual', 'projected', 'possible', 'differential', 'schedule', 'kalman', 'snapshot']:
+        os.makedirs(tempdir + '/' + path + '/' + args.year + '/figures/' + section)
+    runArgs = argparse.Namespace(**vars(args))
+    if not args.sleeper:
+      runArgs.inputFile = tempdir + '/fast/' + args.year + '/' + os.path.basename(args.inputFile)
+      shutil.copy(args.inputFile, runArgs.inputFile)
+    LEAGUE = tempdir + '/fast'
+    with plt.rc_context({'text.usetex': False}), contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+      warnings.simplefilter('ignore')
+      actualScoreAnalysis(leagueData, teams, fast, runArgs)
+      projectedScoreAnalysis(leagueData, teams, fast, runArgs)
+      possibleScoreAnalysis(leagueData, teams, fast, runArgs)
+      pointDifferentialAnalysis(leagueData, teams, fast, runArgs)
+      scheduleSwapAnalysis(leagueData, teams, runArgs)
+      kalmanAnalysis(leagueData, teams, fast, runArgs)
+      regressionAnalysis(leagueData, teams, fast, runArgs)
+      if np.any(snapshots['played']):
+        snapshotAnalysis(leagueData, teams, None, runArgs)
+    LEAGUE = tempdir + '/reference'
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore')
+      referenceScoreTex(teams, runArgs)
+      referenceScheduleSwapTex(leagueData, teams, runArgs)
+      referenceKalmanTex(leagueData, teams, runArgs)
+      if not np.any(np.isnan(actual)):
+        referenceRegressionAnalysis(leagueData, teams, runArgs)
+      referenceSnapshotTex(leagueData, teams, runArgs)
+    #-----------------------------------
+    # A file missing on either side is a
+    # mismatch too.
+    #-----------------------------------
+    texnames = {}
+    for path in ['fast', 'reference']:
+      texnames[path] = set([name for name in os.listdir(tempdir + '/' + path + '/' + args.year) if name.endswith('.tex')])
+    for texname in sorted(texnames['fast'] | texnames['reference']):
+      if texname not in texnames['fast'] or texname not in texnames['reference']:
+        mismatches.append(texname + ': only written by the ' + ('reference' if texname in texnames['reference'] else 'fast') + ' path')
+        continue
+      compareTex(texname, tempdir + '/reference/' + args.year + '/' + texname, tempdir + '/fast/' + args.year + '/' + texname, mismatches)
+  finally:
+    LEAGUE = league
+    shutil.rmtree(tempdir)
+
+  return mismatches
+#----------------------------------------------------------------------
+# Function to verify the Sleeper importer against a local stub server
+# that serves the saved JSON of --sleeper-dir with ETags. The league is
+# imported twice through the connection pool and the on-disk cache:
+# both imports must match reading the directory directly, and the
+# second must only revalidate (HTTP 304) every document.
+# ----------
+# Arguments:
+# ----------
+# args     (object)  command line arguments, with --sleeper-dir
+# ----------
+# Returns:
+# ----------
+# mismatches (list)  list of mismatch descriptions
+#----------------------------------------------------------------------
+def verifySleeper(args):
+  global LEAGUE
+  mismatches = []
+  statuses   = []
+  directory  = args.sleeper_dir.rstrip('/')
+  #------------------------------------------
+  # Stub server, answering every API path with
+  # the saved file, or null if there is none.
+  #------------------------------------------
+  class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    def do_GET(self):
+      path = directory + urllib.parse.urlsplit(self.path).path[len('/v1'):] + '.json'
+      body = b'null'
+      if os.path.isfile(path):
+        with open(path, 'rb') as f:
+          body = f.read()
+      etag   = '"' + hashlib.sha1(body).hexdigest() + '"'
+      status = 304 if self.headers.get('If-None-Match') == etag else 200
+      statuses.append(status)
+      self.send_response(status)
+      self.send_header('ETag', etag)
+      self.send_header('Content-Type', 'application/json')
+      self.send_header('Content-Length', str(len(body) if status == 200 else 0))
+      self.end_headers()
+      if status == 200:
+        self.wfile.write(body)
+    def log_message(self, *a_Args):
+      return
+
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  stubArgs = argparse.Namespace(**vars(args))
+  stubArgs.sleeper_url, stubArgs.sleeper_dir = 'http://127.0.0.1:' + str(server.server_port) + '/v1', None
+  #---------------------------------------------
+  # Import from the directory, then twice through
+  # the stub server with a fresh cache.
+  #---------------------------------------------
+  league  = LEAGUE
+  tempdir = tempfile.mkdtemp()
+  try:
+    reference = sleeperData(args)
+    teams     = list(reference.columns.values)[1:-1]
+    LEAGUE    = tempdir
+    os.makedirs(LEAGUE + '/' + args.year)
+    for attempt, expected in [('first', 200), ('second', 304)]:
+      del statuses[:]
+      fetched = sleeperData(stubArgs)
+      if list(fetched.columns.values) != list(reference.columns.values) or list(fetched['Sheet']) != list(reference['Sheet']):
+        mismatches.append('Sleeper ' + attempt + ' import: sheets or teams differ from the saved JSON')
+        continue
+      compareValues('Sleeper ' + attempt + ' import', reference.iloc[:, 0:-1].to_numpy(dtype=float), fetched.iloc[:, 0:-1].to_numpy(dtype=float), [range(0, len(reference)), ['Week'] + teams], mismatches)
+      if not statuses or statuses.count(expected) != len(statuses):
+        mismatches.append('Sleeper ' + attempt + ' import: ' + str(len(statuses) - statuses.count(expected)) + ' of ' + str(len(statuses)) + ' requests not answered with HTTP ' + str(expected))
+  finally:
+    server.shutdown()
+    server.server_close()
+    LEAGUE = league
+    shutil.rmtree(tempdir)
+
+  return mismatches
+#----------------------------------------------------------------------
+# Function to run the --verify mode on the input workbook and on
+# synthetic leagues, and report every mismatch.
+# ----------
+# Arguments:
+# ----------
+# args     (object)  command line arguments
+#----------------------------------------------------------------------
+def verify(args):
+  verifyArgs = argparse.Namespace(**vars(args))
+  verifyArgs.html, verifyArgs.build = False, False
+  leagues    = [('Sleeper league ' + args.sleeper if args.sleeper else args.inputFile, args.inputFile, args.sleeper)]
+  failed     = False
+  tempdir    = tempfile.mkdtemp()
+  try:
+    for seed in range(0, args.synthetic):
+      rng      = np.random.default_rng(seed)
+      workbook = tempdir + '/synthetic_' + str(seed) + '.xlsx'
+      syntheticLeague(workbook, 2*int(rng.integers(2, 17)), int(rng.integers(2, 19)), seed)
+      leagues.append((workbook, workbook, None))
+
+    if args.sleeper and args.sleeper_dir:
+      print("Verifying the Sleeper importer against a local stub server...")
+      mismatches = verifySleeper(verifyArgs)
+      for mismatch in mismatches:
+        print("  MISMATCH: " + mismatch)
+      print("Finished verifying the Sleeper importer: " + str(len(mismatches)) + " mismatches.\n")
+      failed = failed or len(mismatches) > 0
+    for name, workbook, sleeper in leagues:
+      print("Verifying " + name + "...")
+      verifyArgs.inputFile = workbook
+      verifyArgs.sleeper   = sleeper
+      mismatches = verifyLeague(verifyArgs)
+      for mismatch in mismatches:
+        print("  MISMATCH: " + mismatch)
+      print("Finished verifying " + name + ": " + str(len(mismatches)) + " mismatches.\n")
+      failed = failed or len(mismatches) > 0
+  finally:
+    shutil.rmtree(tempdir)
+
+  if failed:
+    sys.exit("ERROR. Fast and reference computations do not agree.")
+
+  return
+#----------------------------------------------------------------------
+# Function to convert the LaTeX used in captions to HTML.
+# ----------
+# Arguments:
+# ----------
+# a_Text   (str)  text, in LaTeX
+# ----------
+# Returns:
+# ----------
+# text     (str)  text, in HTML
+#----------------------------------------------------------------------
+def texToHTML(a_Text):
+  text = html.escape(a_Text, quote=False)
+  text = re.sub(r'\\frac\{((?:[^{}]|\{[^{}]*\})*)\}\{((?:[^{}]|\{[^{}]*\})*)\}', r'(\1)/(\2)', text)
+  for _ in range(0, 2):
+    text = re.sub(r'\\textit\{([^{}]*)\}', r'<i>\1</i>', text)
+    text = re.sub(r'\\textbf\{([^{}]*)\}', r'<b>\1</b>', text)
+    text = re.sub(r'\\text\{([^{}]*)\}', r'\1', text)
+  text = text.replace('\\%', '%').replace('\\sim', '~').replace('^2', '<sup>2</sup>').replace('$', '')
+
+  return text
+#----------------------------------------------------------------------
+# Function to assemble the HTML report from the figures and tables
+# collected during the analysis. The report is a single, self-contained
+# .html file and does not require a LaTeX installation.
+# ----------
+# Arguments:
+# ----------
+# args     (object)  command line arguments
+#----------------------------------------------------------------------
+def buildHTMLReport(args):
+  htmlfile = open(LEAGUE + '/' + args.year + '/report.html', 'w')
+  htmlfile.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n')
+  htmlfile.write('<title>' + html.escape(os.path.basename(os.path.normpath(LEAGUE))) + ' Fantasy Football Report for ' + html.escape(args.year) + '</title>\n')
+  htmlfile.write('<style>\n')
+  htmlfile.write('body {font-family: serif; max-width: 1000px; margin: auto;}\n')
+  htmlfile.write('figure {text-align: center; margin: 1em 0;}\n')
+  htmlfile.write('figure img {display: inline-block; vertical-align: top;}\n')
+  htmlfile.write('table {border-collapse: collapse; margin: 1em auto;}\n')
+  htmlfile.write('th, td {padding: 2px 8px; text-align: right;}\n')
+  htmlfile.write('</style>\n</head>\n<body>\n')
+  htmlfile.write('<h1>' + html.escape(os.path.basename(os.path.normpath(LEAGUE))) + ' Fantasy Football Report for ' + html.escape(args.year) + '</h1>\n')
+  #-----------------------------------
+  # Write sections in the report order.
+  #-----------------------------------
+  for section, title in HTML_SECTIONS:
+    if not htmlReport[section]:
+      continue
+    htmlfile.write('<h2>' + title + '</h2>\n')
+    #-----------------------------------------
+    # A <figure> is opened by its first image
+    # or table and closed by its caption.
+    #-----------------------------------------
+    opened = False
+    for item in htmlReport[section]:
+      if not opened:
+        htmlfile.write('<figure>\n')
+        opened = True
+      if 'figure' in item:
+        htmlfile.write('<img style="width:' + str(int(item['width']*100)) + '%" src="data:image/svg+xml;base64,' + base64.b64encode(item['figure'].encode('utf-8')).decode('ascii') + '">\n')
+        continue
+      if 'table' in item:
+        htmlfile.write(item['table'])
+      htmlfile.write('<figcaption>' + texToHTML(item['caption']) + '</figcaption>\n</figure>\n')
+      opened = False
+    if opened:
+      htmlfile.write('</figure>\n')
+
+  htmlfile.write('</body>\n</html>\n')
+  htmlfile.close()
+
+  return
+
+#-------------
+# Main script.
+#------------- 
+if __name__ == '__main__':
+  #---------------------------
+  # Read command line options.
+  #---------------------------
+  parser = argparse.ArgumentParser(description='This file is used to generate plots related\
+                                                to the fantasy football league data for the\
+                                                "LEAGUE Squad" league. Report generation is optional.')
+  parser.add_argument('inputFile', metavar='i', type=str, nargs='?',
+                      help='the file path to the data set file (not needed with --sleeper)')
+  parser.add_argument('year', metavar='y', type=str,
+                      help='the season to analyze')
+  parser.add_argument('--all', action='store_true',
+                      help='flag to make all plots')
+  parser.add_argument('--a', action='store_true',
+                      help='flag to make plots for actual scores')
+  parser.add_argument('--pr', action='store_true',
+                      help='flag to make plots for projected scores')
+  parser.add_argument('--po', action='store_true',
+                      help='flag to make plots for possible scores')
+  parser.add_argument('--d', action='store_true',
+                      help='flag to make plots for matchup differentials')
+  parser.add_argument('--s', action='store_true',
+                      help='flag to make plots for schedule swaps and strength of schedule')
+  parser.add_argument('--k', action='store_true',
+                      help='flag to filter team strengths and predict next week win probabilities')
+  parser.add_argument('--kalman-projected', action='store_true',
+                      help='flag to use projected scores as a covariate of the team strength filter')
+  parser.add_argument('--r', action='store_true',
+                      help='flag to perform regression analysis of league data')
+  parser.add_argument('--whis', metavar=('LOW', 'HIGH'), type=float, nargs=2, default=[5, 95],
+                      help='box plot whisker percentiles (default: 5 95)')
+  parser.add_argument('--as-of-week', metavar='K', type=int,
+                      help='write a snapshot of the season statistics and regressions after week K')
+  parser.add_argument('--all-weeks', action='store_true',
+                      help='flag to write snapshots after every played week of the season')
+  parser.add_argument('--verify', action='store_true',
+                      help='flag to check the fast computations against the reference ones, instead of making plots')
+  parser.add_argument('--synthetic', metavar='N', type=int, default=3,
+                      help='number of synthetic leagues to also verify (default: 3)')
+  parser.add_argument('--sleeper', metavar='LEAGUE_ID', type=str,
+                      help='import the league data from Sleeper instead of the data set file')
+  parser.add_argument('--sleeper-url', metavar='URL', type=str, default=SLEEPER_URL,
+                      help='base URL of the Sleeper API (default: ' + SLEEPER_URL + ')')
+  parser.add_argument('--sleeper-dir', metavar='DIR', type=str,
+                      help='import saved Sleeper JSON from DIR instead of fetching it')
+  parser.add_argument('--print', action='store_true',
+                      help='flag to execute print statements')
+  parser.add_argument('--build', action='store_true',
+                      help='flag to build LaTeX report')
+  parser.add_argument('--html', action='store_true',
+                      help='flag to build HTML report (does not require LaTeX)')
+  
+  args = parser.parse_args()
+  #--------------------------------------------------
+  # Set LaTeX fonts, unless only building HTML report.
+  #--------------------------------------------------
+  plt.rc('text', usetex=args.build or not args.html)
+  plt.rc('font', family='serif')
+  #-----------------------------
+  # Check environment variables.
+  #-----------------------------
+  try:
+    LEAGUE = os.environ['LEAGUE']
   except KeyError:
     sys.exit("-------------------\nCOMMAND LINE ERROR:\n-------------------\nSet the LEAUGE environment variable.")
+  if args.inputFile is None and not args.sleeper:
+    sys.exit("-------------------\nCOMMAND LINE ERROR:\n-------------------\nGive the data set file, or a Sleeper league with --sleeper.")
+  #-----------------------------------------
+  # Verify fast against reference computations.
+  #-----------------------------------------
+  if args.verify:
+    verify(args)
+    sys.exit(0)
   #-------------------
   # Build directories.
   #-------------------
@@ -778,15 +3086,27 @@ if __name__ == '__main__':
   if not os.path.exists(LEAGUE + '/' + args.year + '/figures/possible/'):
     os.makedirs(LEAGUE + '/' + args.year + '/figures/possible/')
   if not os.path.exists(LEAGUE + '/' + args.year + '/figures/differential/'):
-    os.makedirs(LEAGUE +  args.year + '/figures/differential/')
+    os.makedirs(LEAGUE + '/' + args.year + '/figures/differential/')
+  if not os.path.exists(LEAGUE + '/' + args.year + '/figures/schedule/'):
+    os.makedirs(LEAGUE + '/' + args.year + '/figures/schedule/')
+  if not os.path.exists(LEAGUE + '/' + args.year + '/figures/kalman/'):
+    os.makedirs(LEAGUE + '/' + args.year + '/figures/kalman/')
+  if not os.path.exists(LEAGUE + '/' + args.year + '/figures/snapshot/'):
+    os.makedirs(LEAGUE + '/' + args.year + '/figures/snapshot/')
   #-----------------------
   # Make example box plot.
   #-----------------------
-  df = pd.DataFrame({'Column 1': np.random.normal(size=100),
-                     'Column 2': np.random.normal(scale=2, size=100)})
-
-  bpdict = df.boxplot(whis=[5, 95], return_type='dict', showmeans=True)
-  annotate_boxplot(bpdict, args, x_loc=1)
+  example  = np.stack([np.random.normal(size=100), np.random.normal(scale=2, size=100)], axis=1)
+  percents = sorted(set(float(q) for q in SUMMARY_QUANTILES + list(args.whis)))
+  boxStats = boxStatistics({'data'     : example,
+                            'percents' : percents,
+                            'team'     : {'mean': np.mean(example, axis=0), 'quantiles': np.percentile(example, percents, axis=0)}},
+                           ['Column 1', 'Column 2'], args.whis)
+  plt.figure()
+  plt.gca().bxp(boxStats, showmeans=True)
+  plt.grid()
+  annotate_boxplot(boxStats, args, x_loc=1)
+  plt.close()
   #------------------------
   # Read in the .xlsx data.
   #------------------------ 
@@ -795,31 +3115,54 @@ if __name__ == '__main__':
   # Get list of team owners.
   #-------------------------
   teamOwnerList = list(leagueData.columns.values)[1:-1]
+  #-----------------------------------------------
+  # Compute and write summary statistics, once for
+  # all of the analyses below.
+  #-----------------------------------------------
+  summary = summaryStatistics(leagueData, teamOwnerList, args.whis)
+  writeSummary(summary, teamOwnerList, args)
   #------------------
   # Scoring analysis.
   #------------------
   if args.all or args.a:
-    actualScoreAnalysis(leagueData, teamOwnerList, args)
+    actualScoreAnalysis(leagueData, teamOwnerList, summary, args)
   #----------------------------
   # Projected scoring analysis.
   #----------------------------
   if args.all or args.pr:
-    projectedScoreAnalysis(leagueData, teamOwnerList, args)
+    projectedScoreAnalysis(leagueData, teamOwnerList, summary, args)
   #---------------------------
   # Possible scoring analysis.
   #---------------------------
   if args.all or args.po:
-    possibleScoreAnalysis(leagueData, teamOwnerList, args)
+    possibleScoreAnalysis(leagueData, teamOwnerList, summary, args)
   #-----------------------------
   # Point differential analysis.
   #-----------------------------
   if args.all or args.d:
-    pointDifferentialAnalysis(leagueData, teamOwnerList, args)
+    pointDifferentialAnalysis(leagueData, teamOwnerList, summary, args)
+  #------------------------
+  # Schedule swap analysis.
+  #------------------------
+  if args.all or args.s:
+    scheduleSwapAnalysis(leagueData, teamOwnerList, args)
+  #-----------------------
+  # Team strength outlook.
+  #-----------------------
+  if args.all or args.k:
+    kalmanAnalysis(leagueData, teamOwnerList, summary, args)
   #---------------------
   # Regression analysis.
   #---------------------
   if args.all or args.r:
-    regressionAnalysis(leagueData, teamOwnerList, args)
+    regressionAnalysis(leagueData, teamOwnerList, summary, args)
+  #----------------------
+  # As-of-week snapshots.
+  #----------------------
+  if args.all_weeks:
+    snapshotAnalysis(leagueData, teamOwnerList, None, args)
+  elif args.as_of_week is not None:
+    snapshotAnalysis(leagueData, teamOwnerList, [args.as_of_week], args)
   #---------------------
   # Build LaTeX report.
   #--------------------
@@ -834,4 +3177,12 @@ if __name__ == '__main__':
     except subprocess.CalledProcessError:
       sys.exit("\nERROR. Could not generate report.")
     print("Finished building the report.")
+  #--------------------
+  # Build HTML report.
+  #--------------------
+  if args.html:
+    print()
+    print("Building the HTML report...")
+    buildHTMLReport(args)
+    print("Finished building the HTML report.")
 